@@ -10,11 +10,14 @@ import asyncio
 from google.auth import exceptions as google_auth_exceptions
 from typing import List
 import re
+import aiohttp
+from db import indexes as db_indexes
 
 load_dotenv()
 
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+AURA_SCHEMA_VALIDATION = os.getenv('AURA_SCHEMA_VALIDATION')  # unset, 'warn' or 'error'
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('bot')
@@ -30,12 +33,28 @@ intents.guild_messages = True
 class MyBot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix='.', intents=intents, case_insensitive=True)
+        self.http_session = None
+        self.collection_store = None  # shared by the games cogs, see games/collection_store.py
 
     async def setup_hook(self):
+        # One pooled HTTP session for every cog, so outbound requests reuse
+        # connections instead of paying TCP/TLS setup per call.
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        )
         await configure_genai_with_retry()
+        try:
+            await db_indexes.bootstrap(validation=AURA_SCHEMA_VALIDATION)
+        except Exception as e:
+            logger.error(f"Database bootstrap failed: {e}")
         await load_all_cogs(self)
         await self.tree.sync()
 
+    async def close(self):
+        await super().close()
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+
 bot = MyBot()
 
 async def configure_genai_with_retry(max_retries: int = 3, retry_delay: int = 5) -> None:
@@ -3,9 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 import asyncio
 from datetime import datetime
-from db.mongo import aura_points_collection
-import motor
-from pymongo import ReturnDocument
+from db.ledger import ledger
 
 class AuraCog(commands.Cog, name="Aura"):
     THUMBS_UP_VALUE = 100
@@ -165,13 +163,7 @@ class AuraCog(commands.Cog, name="Aura"):
             aura_count = (thumbs_up_count * self.THUMBS_UP_VALUE) + (thumbs_down_count * self.THUMBS_DOWN_VALUE)
             author_id = str(referenced_author.id)
             
-            # Use $inc to increment aura points and retrieve updated document
-            update_result = await aura_points_collection.find_one_and_update(
-                {"user_id": author_id},
-                {"$inc": {"points": aura_count}},
-                return_document=ReturnDocument.AFTER  # Ensure correct import
-            )
-            new_points = update_result['points'] if update_result else aura_count
+            new_points = await ledger.add(author_id, aura_count)
             
             if aura_count < 0:
                 # Optionally handle negative points
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-from db.mongo import aura_points_collection
+from db.ledger import ledger
 
 class CheckAura(commands.Cog, name="Check Aura"):
     def __init__(self, bot):
@@ -23,8 +23,7 @@ class CheckAura(commands.Cog, name="Check Aura"):
     async def checkaura_logic(self, ctx, member: discord.Member = None):
         member = member or ctx.author
         user_id = str(member.id)
-        user_doc = await aura_points_collection.find_one({"user_id": user_id})
-        points = user_doc['points'] if user_doc else 0
+        points = await ledger.get(user_id)
 
         embed = discord.Embed(
             title="🔮 Aura Points Checker",
@@ -2,7 +2,11 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime, timedelta
-from db.mongo import aura_points_collection, aura_data_collection
+from db.mongo import aura_data_collection
+from db.ledger import ledger
+from db.cooldowns import claim_cooldown
+
+DAILY_COOLDOWN = timedelta(hours=24)
 
 class Dailyaura(commands.Cog, name="Daily Aura"):
     def __init__(self, bot):
@@ -31,69 +35,49 @@ class Dailyaura(commands.Cog, name="Daily Aura"):
         user_id = str(ctx.author.id if isinstance(ctx, commands.Context) else ctx.user.id)
         user = ctx.author if isinstance(ctx, commands.Context) else ctx.user
 
-        user_data = await aura_data_collection.find_one({"user_id": user_id})
-        if user_data:
-            last_claim_time = user_data.get("last_claim_timestamp")
-            if last_claim_time:
-                last_claim_time = datetime.fromtimestamp(last_claim_time)
-                time_difference = current_time - last_claim_time
-                if time_difference < timedelta(hours=24):
-                    remaining_time = timedelta(hours=24) - time_difference
-                    hours, remainder = divmod(int(remaining_time.total_seconds()), 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    
-                    embed = discord.Embed(
-                        description=f"⏰ You need to wait **{hours}h {minutes}m {seconds}s** before claiming again.",
-                        color=discord.Color.from_rgb(43, 45, 49)
-                    )
-                    await self.send_response(ctx, embed=embed)
-                    return
-
-        if not user_data:
-            user_data = {"user_id": user_id, "streak": 0, "last_claim": None, "last_claim_timestamp": None}
-
-        last_claim_str = user_data.get("last_claim")
         current_date = current_time.strftime("%Y-%m-%d")
+        yesterday = (current_time.date() - timedelta(days=1)).strftime("%Y-%m-%d")
+        now_ts = current_time.timestamp()
+
+        # One conditional update: only matches once the 24h cooldown is over, and
+        # extends the streak if the previous claim was yesterday, else restarts it.
+        user_data, claimed = await claim_cooldown(
+            aura_data_collection,
+            user_id,
+            ready={"$or": [
+                {"last_claim_timestamp": None},
+                {"last_claim_timestamp": {"$lte": now_ts - DAILY_COOLDOWN.total_seconds()}}
+            ]},
+            update=[{"$set": {
+                "streak": {"$cond": [
+                    {"$eq": ["$last_claim", yesterday]},
+                    {"$add": [{"$ifNull": ["$streak", 0]}, 1]},
+                    1
+                ]},
+                "last_claim": current_date,
+                "last_claim_timestamp": now_ts
+            }}],
+            new_doc={"streak": 1, "last_claim": current_date, "last_claim_timestamp": now_ts}
+        )
 
-        if last_claim_str:
-            try:
-                last_claim_date = datetime.strptime(last_claim_str, "%Y-%m-%d").date()
-                if last_claim_date > current_time.date():
-                    last_claim_str = None
-                    user_data["last_claim"] = None
-            except (ValueError, TypeError):
-                last_claim_str = None
-                user_data["last_claim"] = None
-
-        if last_claim_str:
-            last_claim_date = datetime.strptime(last_claim_str, "%Y-%m-%d").date()
-            if last_claim_date == (current_time.date() - timedelta(days=1)):
-                user_data["streak"] = user_data.get("streak", 0) + 1
-            else:
-                user_data["streak"] = 1
-        else:
-            user_data["streak"] = 1
+        if not claimed:
+            last_claim_time = datetime.fromtimestamp((user_data or {}).get("last_claim_timestamp") or now_ts)
+            remaining_time = max(DAILY_COOLDOWN - (current_time - last_claim_time), timedelta())
+            hours, remainder = divmod(int(remaining_time.total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
 
-        user_data["last_claim"] = current_date
-        user_data["last_claim_timestamp"] = current_time.timestamp()
+            embed = discord.Embed(
+                description=f"⏰ You need to wait **{hours}h {minutes}m {seconds}s** before claiming again.",
+                color=discord.Color.from_rgb(43, 45, 49)
+            )
+            await self.send_response(ctx, embed=embed)
+            return
 
         streak_bonus = user_data["streak"] * 10
         base_points = 50
         total_bonus = base_points + streak_bonus
 
-        user_doc = await aura_points_collection.find_one({"user_id": user_id})
-        new_total = (user_doc['points'] if user_doc else 0) + total_bonus
-        await aura_points_collection.update_one(
-            {"user_id": user_id},
-            {"$set": {"points": new_total}},
-            upsert=True
-        )
-
-        await aura_data_collection.update_one(
-            {"user_id": user_id},
-            {"$set": user_data},
-            upsert=True
-        )
+        new_total = await ledger.add(user_id, total_bonus)
 
         # Create success embed
         embed = discord.Embed(
@@ -3,9 +3,8 @@ from discord.ext import commands
 from discord import app_commands
 import asyncio
 from datetime import datetime
-from db.mongo import aura_points_collection, admins_collection
-import motor
-from pymongo import ReturnDocument
+from db.authorization import authorization
+from db.ledger import ledger
 
 class GiveAura(commands.Cog, name="Aura Points Management"):
     def __init__(self, bot):
@@ -15,32 +14,16 @@ class GiveAura(commands.Cog, name="Aura Points Management"):
 
     @commands.command(name='giveaura', help="Give aura points to a user")
     async def giveaura_command(self, ctx, member: discord.Member, points: int):
-        authorized = await admins_collection.find_one({"user_id": str(ctx.author.id)})
-        if not authorized:
-            error_embed = discord.Embed(
-                description="❌ You are not authorized to use this command.",
-                color=discord.Color.from_rgb(255, 85, 85)
-            )
-            await self.send_response(ctx, embed=error_embed)
-            return
-        await self.give_aura_logic(ctx, member, points) 
+        await self.give_aura_logic(ctx, member, points)
 
     @app_commands.command(name='giveaura', description="Give aura points to a user")
     async def give_aura_slash(self, interaction: discord.Interaction, member: discord.Member, points: int):
-        authorized = await admins_collection.find_one({"user_id": str(interaction.user.id)})
-        if not authorized:
-            error_embed = discord.Embed(
-                description="❌ You are not authorized to use this command.",
-                color=discord.Color.from_rgb(255, 85, 85)
-            )
-            await self.send_response(interaction, embed=error_embed)
-            return
         await self.give_aura_logic(interaction, member, points)
 
     async def give_aura_logic(self, ctx, member: discord.Member, points: int):
         print(f"give_aura_logic called by {ctx.author if isinstance(ctx, commands.Context) else ctx.user}")  # Debug statement
-        authorized = await admins_collection.find_one({"user_id": str(ctx.author.id if isinstance(ctx, commands.Context) else ctx.user.id)})
-        print(f"Authorized: {authorized is not None}")  # Debug statement
+        authorized = await authorization.is_admin(ctx.author.id if isinstance(ctx, commands.Context) else ctx.user.id)
+        print(f"Authorized: {authorized}")  # Debug statement
         if not authorized:
             error_embed = discord.Embed(
                 description="❌ You are not authorized to use this command.",
@@ -63,12 +46,7 @@ class GiveAura(commands.Cog, name="Aura Points Management"):
         user = ctx.author if isinstance(ctx, commands.Context) else ctx.user
 
         async with self.lock:
-            update_result = await aura_points_collection.find_one_and_update(
-                {"user_id": user_id},
-                {"$inc": {"points": points}},
-                return_document=ReturnDocument.AFTER
-            )
-            new_points = update_result['points'] if update_result else points
+            new_points = await ledger.add(user_id, points)
             old_points = new_points - points
 
         # Create success embed
@@ -3,9 +3,93 @@ from discord.ext import commands
 from discord import app_commands
 import os
 import json
+import asyncio
+import logging
+from collections import OrderedDict
 from typing import Union, List, Tuple, Optional
 from discord.ext import commands, tasks
-from db.mongo import aura_points_collection
+from sortedcontainers import SortedList
+from db.ledger import ledger
+from db.user_names import user_names
+
+PAGE_SIZE = 5
+MAX_GUILD_VIEWS = 1000  # materialized per-guild leaderboards kept in memory
+
+
+class RankedIndex:
+    """Every user's balance, kept sorted by (points desc, user_id).
+
+    Updates, rank lookups and page slices are all O(log n) (plus the page
+    size), so rendering a leaderboard never touches Mongo or re-sorts.
+    """
+
+    def __init__(self):
+        self._points = {}  # user_id -> points
+        self._ranked = SortedList()  # (-points, user_id)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __contains__(self, user_id):
+        return str(user_id) in self._points
+
+    def get(self, user_id):
+        return self._points.get(str(user_id))
+
+    def update(self, user_id, points):
+        user_id = str(user_id)
+        old = self._points.get(user_id)
+        if old == points:
+            return
+        if old is not None:
+            self._ranked.remove((-old, user_id))
+        self._points[user_id] = points
+        self._ranked.add((-points, user_id))
+
+    def remove(self, user_id):
+        user_id = str(user_id)
+        old = self._points.pop(user_id, None)
+        if old is not None:
+            self._ranked.remove((-old, user_id))
+
+    def load(self, balances, keep=()):
+        """Replace the contents with (user_id, points) pairs, except users in `keep`.
+
+        Returns how many users were added, changed or dropped.
+        """
+        keep = set(keep)
+        fresh = {str(user_id): points for user_id, points in balances}
+        for user_id in keep:
+            if user_id in self._points:
+                fresh[user_id] = self._points[user_id]
+        changes = sum(1 for user_id, points in fresh.items() if self._points.get(user_id) != points)
+        changes += sum(1 for user_id in self._points if user_id not in fresh)
+        self._points = fresh
+        self._ranked = SortedList((-points, user_id) for user_id, points in fresh.items())
+        return changes
+
+    def top(self, n, offset=0):
+        """(user_id, points) for ranks offset+1 .. offset+n, highest first."""
+        return [(user_id, -neg) for neg, user_id in self._ranked[offset:offset + n]]
+
+    def bottom(self, n, offset=0):
+        """The n lowest balances after skipping `offset` from the bottom, lowest first."""
+        end = len(self._ranked) - offset
+        if end <= 0:
+            return []
+        return [(user_id, -neg) for neg, user_id in reversed(self._ranked[max(0, end - n):end])]
+
+    def page(self, k, size=PAGE_SIZE):
+        return self.top(size, k * size)
+
+    def rank(self, user_id):
+        """1-based rank of a user, or None if they have no balance."""
+        user_id = str(user_id)
+        points = self._points.get(user_id)
+        if points is None:
+            return None
+        return self._ranked.index((-points, user_id)) + 1
+
 
 class LeaderboardView(discord.ui.View):
     def __init__(self, cog, ctx, leaderboard_type="server", page=0):
@@ -36,7 +120,7 @@ class LeaderboardView(discord.ui.View):
             # Only enable navigation for server leaderboard
             self.previous_page.disabled = self.page == 0
             total_users = self.total_users
-            self.next_page.disabled = (self.page + 1) * 5 >= total_users
+            self.next_page.disabled = (self.page + 1) * PAGE_SIZE >= total_users
 
     @discord.ui.button(label="🌍 Global", style=discord.ButtonStyle.secondary, custom_id="global_lb")
     async def global_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -69,17 +153,122 @@ class Leaderboard(commands.Cog, name="Aura Management"):
     
     def __init__(self, bot):
         self.bot = bot
-        self.aura_points = {}
-        self.user_cache = {}
+        self.logger = logging.getLogger('aura_leaderboard')
+        self.index = RankedIndex()
+        self.guild_views = OrderedDict()  # guild_id -> (member ids, RankedIndex), least recently used first
+        self.member_guilds = {}  # user_id -> ids of materialized guilds they are in
+        self._loaded = False
+        self._reconcile_lock = asyncio.Lock()
+        self._changed_during_reconcile = None
+        ledger.add_listener(self.on_balance_changed)
         self.refresh_leaderboard.start()
 
     def cog_unload(self):
+        ledger.remove_listener(self.on_balance_changed)
         self.refresh_leaderboard.cancel()
 
+    def on_balance_changed(self, user_id, points):
+        user_id = str(user_id)
+        self.index.update(user_id, points)
+        for guild_id in self.member_guilds.get(user_id, ()):
+            self.guild_views[guild_id][1].update(user_id, points)
+        if self._changed_during_reconcile is not None:
+            self._changed_during_reconcile.add(str(user_id))
+
+    async def reconcile(self):
+        """Reload the index from Mongo, picking up changes made outside the ledger.
+
+        Balances that change while the snapshot is being read keep their
+        live value instead of being overwritten by the older snapshot.
+        """
+        async with self._reconcile_lock:
+            self._changed_during_reconcile = set()
+            try:
+                ranking = await ledger.ranking()
+                changes = self.index.load(ranking, keep=self._changed_during_reconcile)
+            finally:
+                self._changed_during_reconcile = None
+            if self._loaded and changes:
+                self.logger.warning(f"Leaderboard index was out of sync with Mongo for {changes} users")
+                # Guild views were built from the stale index; rebuild them on next use.
+                self.guild_views.clear()
+                self.member_guilds.clear()
+            self._loaded = True
+
+    def get_guild_view(self, guild):
+        """The guild's members ranked, built from the global index on first use.
+
+        Afterwards the view is kept current by ledger changes and member
+        joins/leaves, so paging never rescans the guild or the global index.
+        """
+        view = self.guild_views.get(guild.id)
+        if view is not None:
+            self.guild_views.move_to_end(guild.id)
+            return view[1]
+
+        member_ids = {str(member.id) for member in guild.members}
+        ranked = RankedIndex()
+        ranked.load((user_id, self.index.get(user_id)) for user_id in member_ids if user_id in self.index)
+        self.guild_views[guild.id] = (member_ids, ranked)
+        for user_id in member_ids:
+            self.member_guilds.setdefault(user_id, set()).add(guild.id)
+
+        while len(self.guild_views) > MAX_GUILD_VIEWS:
+            self.drop_guild_view(next(iter(self.guild_views)))
+        return ranked
+
+    def drop_guild_view(self, guild_id):
+        view = self.guild_views.pop(guild_id, None)
+        if view is None:
+            return
+        for user_id in view[0]:
+            guilds = self.member_guilds.get(user_id)
+            if guilds is not None:
+                guilds.discard(guild_id)
+                if not guilds:
+                    del self.member_guilds[user_id]
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        view = self.guild_views.get(member.guild.id)
+        if view is None:
+            return
+        user_id = str(member.id)
+        view[0].add(user_id)
+        self.member_guilds.setdefault(user_id, set()).add(member.guild.id)
+        points = self.index.get(user_id)
+        if points is not None:
+            view[1].update(user_id, points)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        view = self.guild_views.get(member.guild.id)
+        if view is None:
+            return
+        user_id = str(member.id)
+        view[0].discard(user_id)
+        view[1].remove(user_id)
+        guilds = self.member_guilds.get(user_id)
+        if guilds is not None:
+            guilds.discard(member.guild.id)
+            if not guilds:
+                del self.member_guilds[user_id]
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.drop_guild_view(guild.id)
+
+    async def ensure_loaded(self):
+        if not self._loaded:
+            await self.reconcile()
+
     @tasks.loop(minutes=5)
     async def refresh_leaderboard(self):
-        """Refresh the leaderboard data periodically."""
-        pass
+        """Reconcile the in-memory index with Mongo periodically."""
+        try:
+            await self.reconcile()
+        except Exception as e:
+            self.logger.error(f"Error reconciling leaderboard index: {e}")
 
     @commands.cooldown(1, 30, commands.BucketType.user)
     @commands.command(name='leaderboard', aliases=['lb'])
@@ -102,12 +291,11 @@ class Leaderboard(commands.Cog, name="Aura Management"):
     async def leaderboard_logic(self, ctx, leaderboard_type):
         print(f"{leaderboard_type.capitalize()} Leaderboard command invoked")
 
-        # Fetch total users asynchronously
         if leaderboard_type == "server":
-            users = await self.get_server_leaderboard(ctx.guild)
+            total_users = len(await self.get_server_leaderboard(ctx.guild))
         else:
-            users = await self.get_global_leaderboard()
-        total_users = len(users)
+            await self.ensure_loaded()
+            total_users = len(self.index)
 
         view = LeaderboardView(self, ctx, leaderboard_type)
         view.total_users = total_users  # Set total_users in the view
@@ -128,30 +316,21 @@ class Leaderboard(commands.Cog, name="Aura Management"):
             users = await self.get_global_leaderboard()
             gif_url = "https://media.giphy.com/media/3o7aCWJavAgtBzLWrS/giphy.gif"
 
-        start_top = page * 5
-        end_top = start_top + 5
-        top_users = users[start_top:end_top]
+        start_top = page * PAGE_SIZE
+        top_users = users.page(page)
+        bottom_users = users.bottom(PAGE_SIZE, start_top)
 
-        total_users = len(users)
-        bottom_users = users[-end_top:-start_top] if start_top > 0 else users[-5:]
+        # Server entries are mentions; global names are resolved for the whole page at once
+        names = {}
+        if leaderboard_type == "global":
+            names = await user_names.resolve(self.bot, [user_id for user_id, _ in top_users + bottom_users])
         
         embed = discord.Embed(title=title)
 
         # Top users display
         top_leaderboard = f"🏅 **Top Aura Points:**\n"
         for index, (user_id, points) in enumerate(top_users, start=start_top + 1):
-            try:
-                if leaderboard_type == "server":
-                    member = ctx.guild.get_member(int(user_id))
-                    user_display = member.mention if member else f"User {user_id}"
-                else:
-                    user = self.bot.get_user(int(user_id))
-                    if user is None:
-                        user = await self.bot.fetch_user(int(user_id))
-                    user_display = user.name if user else f"User {user_id}"
-            except Exception as e:
-                print(f"Error fetching user {user_id}: {e}")
-                user_display = f"User {user_id}"
+            user_display = self.display_name(ctx, leaderboard_type, user_id, names)
             
             line = f"{index}. {user_display}: **{points:,}** points\n"
             top_leaderboard += line
@@ -161,25 +340,11 @@ class Leaderboard(commands.Cog, name="Aura Management"):
         # Bottom users display
         if bottom_users:
             bottom_leaderboard = f"💨 **Bottom Aura Points:**\n"
-            # Sort bottom users by points in ascending order (lowest first)
-            bottom_users = sorted(bottom_users, key=lambda x: x[1])
-            
-            # Calculate starting position based on page number
-            start_position = (page * 5) + 1
+            # Bottom users come lowest first; positions count up from the bottom
+            start_position = start_top + 1
             
             for i, (user_id, points) in enumerate(bottom_users):
-                try:
-                    if leaderboard_type == "server":
-                        member = ctx.guild.get_member(int(user_id))
-                        user_display = member.mention if member else f"User {user_id}"
-                    else:
-                        user = self.bot.get_user(int(user_id))
-                        if user is None:
-                            user = await self.bot.fetch_user(int(user_id))
-                        user_display = user.name if user else f"User {user_id}"
-                except Exception as e:
-                    print(f"Error fetching user {user_id}: {e}")
-                    user_display = f"User {user_id}"
+                user_display = self.display_name(ctx, leaderboard_type, user_id, names)
                 
                 position = start_position + i
                 line = f"{position}. {user_display}: **{points:,}** points\n"
@@ -190,7 +355,7 @@ class Leaderboard(commands.Cog, name="Aura Management"):
         embed.set_thumbnail(url=gif_url)
         
         if leaderboard_type == "server":
-            total_pages = (len(users) + 4) // 5
+            total_pages = (len(users) + PAGE_SIZE - 1) // PAGE_SIZE
             footer_text = f"Page {page + 1}/{total_pages} | Server: {ctx.guild.name}"
             embed.set_footer(text=footer_text)
         else:
@@ -198,30 +363,20 @@ class Leaderboard(commands.Cog, name="Aura Management"):
 
         return embed
 
-    async def get_server_leaderboard(self, guild):
-        # Fetch all users with aura points
-        all_users_cursor = aura_points_collection.find().sort("points", -1)
-        all_users = await all_users_cursor.to_list(length=None)
-
-        # Get a set of member IDs in the guild for faster lookup
-        guild_member_ids = set(member.id for member in guild.members)
-
-        # Filter users to those who are members of the guild
-        server_users = [
-            (user_data['user_id'], user_data['points'])
-            for user_data in all_users
-            if int(user_data['user_id']) in guild_member_ids
-        ]
-
-        # Sort the list by points in descending order
-        server_users.sort(key=lambda x: x[1], reverse=True)
+    def display_name(self, ctx, leaderboard_type, user_id, names):
+        if leaderboard_type == "server":
+            member = ctx.guild.get_member(int(user_id))
+            return member.mention if member else f"User {user_id}"
+        return names.get(str(user_id), f"User {user_id}")
 
-        return server_users
+    async def get_server_leaderboard(self, guild):
+        """The guild's members ranked, as a RankedIndex."""
+        await self.ensure_loaded()
+        return self.get_guild_view(guild)
 
     async def get_global_leaderboard(self):
-        global_points_cursor = aura_points_collection.find().sort("points", -1)
-        global_points = await global_points_cursor.to_list(length=None)
-        return [(user_data['user_id'], user_data['points']) for user_data in global_points]
+        await self.ensure_loaded()
+        return self.index
 
     def get_medal(self, position):
         medals = {1: "🥇", 2: "🥈", 3: "🥉"}
@@ -5,7 +5,7 @@ import os
 import json
 import datetime
 from typing import Optional
-from db.mongo import aura_points_collection
+from db.ledger import ledger
 
 class Profile(commands.Cog, name="Profile Management"):
     def __init__(self, bot):
@@ -24,8 +24,7 @@ class Profile(commands.Cog, name="Profile Management"):
         try:
             member = member or (ctx.author if isinstance(ctx, commands.Context) else ctx.user)
             user_id = str(member.id)
-            data = await aura_points_collection.find_one({'user_id': user_id})  # Add await here
-            points = data['points'] if data else 0
+            points = await ledger.get(user_id)
 
             # Create embed
             embed_color = 0x2b2d31
@@ -2,7 +2,11 @@ import discord
 from discord.ext import commands
 import random
 from datetime import datetime, timedelta
-from db.mongo import aura_points_collection, last_used_collection
+from db.mongo import last_used_collection
+from db.ledger import ledger
+from db.cooldowns import claim_cooldown
+
+BONUS_COOLDOWN = timedelta(hours=3)
 
 class RandomBonus(commands.Cog, name="Random Bonus"):
     def __init__(self, bot):
@@ -14,21 +18,31 @@ class RandomBonus(commands.Cog, name="Random Bonus"):
         user_id = str(ctx.author.id if isinstance(ctx, commands.Context) else ctx.user.id)
         user = ctx.author if isinstance(ctx, commands.Context) else ctx.user
 
-        last_used_doc = await last_used_collection.find_one({"user_id": user_id})
-        if last_used_doc:
-            last_time = last_used_doc['last_used']
-            time_difference = current_time - last_time
-            if time_difference < timedelta(hours=3):
-                remaining_time = timedelta(hours=3) - time_difference
-                hours, remainder = divmod(int(remaining_time.total_seconds()), 3600)
-                minutes, seconds = divmod(remainder, 60)
-                
-                embed = discord.Embed(
-                    description=f"⏰ You need to wait **{hours}h {minutes}m {seconds}s** before claiming again.",
-                    color=discord.Color.from_rgb(43, 45, 49)  # #2B2D31
-                )
-                await self.send_response(ctx, embed=embed)
-                return
+        # Claiming the cooldown and checking it are the same update, so two
+        # concurrent commands can't both get a bonus.
+        last_used_doc, claimed = await claim_cooldown(
+            last_used_collection,
+            user_id,
+            ready={"$or": [
+                {"last_used": None},
+                {"last_used": {"$lte": current_time - BONUS_COOLDOWN}}
+            ]},
+            update={"$set": {"last_used": current_time}},
+            new_doc={"last_used": current_time}
+        )
+
+        if not claimed:
+            last_time = (last_used_doc or {}).get('last_used') or current_time
+            remaining_time = max(BONUS_COOLDOWN - (current_time - last_time), timedelta())
+            hours, remainder = divmod(int(remaining_time.total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
+
+            embed = discord.Embed(
+                description=f"⏰ You need to wait **{hours}h {minutes}m {seconds}s** before claiming again.",
+                color=discord.Color.from_rgb(43, 45, 49)  # #2B2D31
+            )
+            await self.send_response(ctx, embed=embed)
+            return
 
         # Calculate bonus points with rarity system
         rarity_roll = random.random()  # Returns a number between 0 and 1
@@ -40,8 +54,7 @@ class RandomBonus(commands.Cog, name="Random Bonus"):
             bonus = random.randint(10, 50)
             rarity_text = "💫 **Bonus Reward**"
 
-        user_doc = await aura_points_collection.find_one({"user_id": user_id})
-        new_total = (user_doc['points'] if user_doc else 0) + bonus
+        new_total = await ledger.add(user_id, bonus)
 
         # Create success embed
         embed = discord.Embed(
@@ -75,20 +88,6 @@ class RandomBonus(commands.Cog, name="Random Bonus"):
         if log_channel:
             await log_channel.send(embed=log_embed)
 
-        # Update aura points
-        await aura_points_collection.update_one(
-            {"user_id": user_id},
-            {"$set": {"points": new_total}},
-            upsert=True
-        )
-
-        # Update last used
-        await last_used_collection.update_one(
-            {"user_id": user_id},
-            {"$set": {"last_used": current_time}},
-            upsert=True
-        )
-
     def save_aura_points(self):
         # Removed: Use MongoDB instead
         pass
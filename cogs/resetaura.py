@@ -1,7 +1,8 @@
 import discord
 from discord.ext import commands
 import asyncio
-from db.mongo import aura_points_collection, admins_collection
+from db.authorization import authorization
+from db.ledger import ledger
 
 class ResetAura(commands.Cog, name="Reset Aura"):
     def __init__(self, bot):
@@ -11,8 +12,7 @@ class ResetAura(commands.Cog, name="Reset Aura"):
 
     @commands.command(name='resetaura')
     async def reset_aura(self, ctx, member: discord.Member = None):
-        authorized = await admins_collection.find_one({"user_id": str(ctx.author.id)})
-        if not authorized:
+        if not await authorization.is_admin(ctx.author.id):
             error_embed = discord.Embed(
                 description="❌ You are not authorized to use this command.",
                 color=discord.Color.from_rgb(255, 85, 85)
@@ -25,10 +25,8 @@ class ResetAura(commands.Cog, name="Reset Aura"):
         user_id = str(member.id)
 
         async with self.lock:
-            user_doc = await aura_points_collection.find_one({"user_id": user_id})
-            if user_doc:
-                old_points = user_doc['points']
-                await aura_points_collection.update_one({"user_id": user_id}, {"$set": {"points": 0}})
+            old_points = await ledger.reset(user_id)
+            if old_points is not None:
                 await ctx.send(f"{member.mention}'s aura points have been reset from {old_points} to 0.")
                 await self.log_event(ctx, f"{member.mention}'s aura points were reset from {old_points} to 0 by {ctx.author.mention}.")
             else:
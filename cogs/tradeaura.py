@@ -4,7 +4,7 @@ from discord import app_commands
 import asyncio
 import os
 import json
-from db.mongo import aura_points_collection, authorized_users_collection
+from db.ledger import ledger
 
 class TradeAura(commands.Cog, name="Trade Aura"):
     def __init__(self, bot):
@@ -98,11 +98,8 @@ class TradeAura(commands.Cog, name="Trade Aura"):
             await self.send_response(ctx, embed=error_embed)
             return
 
-        user_doc = await aura_points_collection.find_one({"user_id": user_id})
-        member_doc = await aura_points_collection.find_one({"user_id": member_id})
-
-        user_aura_points = user_doc['points'] if user_doc else 0
-        if user_aura_points < points:
+        # Conditional debit plus credit: the balance check and the transfer are one step
+        if await ledger.transfer(user_id, member_id, points) is None:
             error_embed = discord.Embed(
                 description="❌ You don't have enough aura points to trade.",
                 color=discord.Color.from_rgb(43, 45, 49)  # #2B2D31
@@ -110,13 +107,6 @@ class TradeAura(commands.Cog, name="Trade Aura"):
             await self.send_response(ctx, embed=error_embed)
             return
 
-        if not member_doc:
-            await aura_points_collection.insert_one({"user_id": member_id, "points": points})
-        else:
-            await aura_points_collection.update_one({"user_id": member_id}, {"$inc": {"points": points}})
-
-        await aura_points_collection.update_one({"user_id": user_id}, {"$inc": {"points": -points}})
-
         confirmation_embed = discord.Embed(
             title="Aura Trade Request",
             description=(
@@ -0,0 +1,110 @@
+"""Who may run the bot's privileged commands.
+
+There are two groups:
+- ADMINS: the aura admins. They are the `user_id` of each document in
+  admins_collection, and they may run giveaura and resetaura.
+- GAME_ADMINS: the brainrot game admins. They are the `authorized_user_ids`
+  list, read from authorized_users.json and from any document in
+  authorized_users_collection.
+
+Both groups are loaded into in-memory sets and reloaded after `ttl` seconds,
+so a permission check is a set lookup instead of a database round trip.
+After changing either collection, call `authorization.invalidate()` (or the
+`.refreshadmin` command) and the next check reloads.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from discord.ext import commands
+
+from db.mongo import admins_collection, authorized_users_collection
+
+logger = logging.getLogger('aura_authorization')
+
+ADMINS = 'admins'
+GAME_ADMINS = 'authorized_users'
+
+
+class Authorization:
+    def __init__(self, admins, authorized_users, authorized_users_file='authorized_users.json', ttl=300):
+        self.admins = admins
+        self.authorized_users = authorized_users
+        self.authorized_users_file = authorized_users_file
+        self.ttl = ttl
+        self._groups = {ADMINS: frozenset(), GAME_ADMINS: frozenset()}
+        self._loaded_at = None
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def _stale(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    async def _admin_ids(self):
+        """The user_id of every document in the admins collection."""
+        user_ids = set()
+        async for doc in self.admins.find({'user_id': {'$exists': True}}, {'_id': 0, 'user_id': 1}):
+            user_ids.add(str(doc['user_id']))
+        return user_ids
+
+    async def _authorized_ids(self):
+        """The `authorized_user_ids` lists stored in the authorized users collection."""
+        user_ids = set()
+        async for doc in self.authorized_users.find({'authorized_user_ids': {'$exists': True}},
+                                                    {'_id': 0, 'authorized_user_ids': 1}):
+            if isinstance(doc['authorized_user_ids'], list):
+                user_ids.update(map(str, doc['authorized_user_ids']))
+        return user_ids
+
+    def _file_user_ids(self):
+        try:
+            with open(self.authorized_users_file, 'r') as f:
+                return set(map(str, json.load(f).get('authorized_user_ids', [])))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.error(f"Error loading {self.authorized_users_file}: {e}")
+            return set()
+
+    async def refresh(self):
+        """Reload both groups now; returns False (keeping the previous sets) on error."""
+        async with self._lock:
+            return await self._load()
+
+    async def _load(self):
+        try:
+            admins = await self._admin_ids()
+            game_admins = await self._authorized_ids() | self._file_user_ids()
+        except Exception as e:
+            logger.error(f"Error loading authorized users, keeping the previous lists: {e}")
+            # Try again on the next check instead of waiting out the TTL.
+            return False
+        self._groups = {ADMINS: frozenset(admins), GAME_ADMINS: frozenset(game_admins)}
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(admins)} admins and {len(game_admins)} game admins")
+        return True
+
+    async def members(self, group=ADMINS):
+        if self._stale():
+            async with self._lock:
+                # Checks queued behind an in-flight reload reuse its result.
+                if self._stale():
+                    await self._load()
+        return self._groups[group]
+
+    async def is_admin(self, user_id, group=ADMINS):
+        return str(user_id) in await self.members(group)
+
+
+authorization = Authorization(admins_collection, authorized_users_collection)
+
+
+def admin_only(group=ADMINS):
+    """Command check that passes only for members of `group`."""
+    async def predicate(ctx):
+        return await authorization.is_admin(ctx.author.id, group)
+    return commands.check(predicate)
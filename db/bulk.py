@@ -0,0 +1,90 @@
+"""Batched bulk writes for imports, migrations and multi-document saves.
+
+Instead of one round trip per document, operations are sent to MongoDB in
+`bulk_write` batches of `batch_size`. Batches are unordered by default, so
+the server can apply them in parallel and one bad document doesn't stop the
+rest of its batch. Each batch is logged with its timing and counts.
+"""
+
+import logging
+import time
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger('aura_bulk')
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _empty_totals():
+    return {'batches': 0, 'operations': 0, 'inserted': 0, 'matched': 0,
+            'modified': 0, 'upserted': 0, 'errors': 0, 'seconds': 0.0}
+
+
+async def _write_batch(collection, batch, ordered, totals):
+    started = time.perf_counter()
+    errors = 0
+    try:
+        result = await collection.bulk_write(batch, ordered=ordered)
+        counts = {
+            'inserted': result.inserted_count,
+            'matched': result.matched_count,
+            'modified': result.modified_count,
+            'upserted': result.upserted_count,
+        }
+    except BulkWriteError as e:
+        details = e.details
+        errors = len(details.get('writeErrors', []))
+        counts = {
+            'inserted': details.get('nInserted', 0),
+            'matched': details.get('nMatched', 0),
+            'modified': details.get('nModified', 0),
+            'upserted': details.get('nUpserted', 0),
+        }
+        logger.error(f"{collection.name}: {errors} of {len(batch)} operations failed, "
+                     f"first error: {details['writeErrors'][0]['errmsg'] if errors else 'n/a'}")
+    elapsed = time.perf_counter() - started
+
+    totals['batches'] += 1
+    totals['operations'] += len(batch)
+    totals['errors'] += errors
+    totals['seconds'] += elapsed
+    for key, value in counts.items():
+        totals[key] += value
+    logger.info(f"{collection.name}: batch {totals['batches']} wrote {len(batch)} operations in "
+                f"{elapsed * 1000:.0f}ms (upserted {counts['upserted']}, modified {counts['modified']}, "
+                f"errors {errors})")
+
+
+async def bulk_write(collection, operations, batch_size=DEFAULT_BATCH_SIZE, ordered=False):
+    """Write an iterable of pymongo operations in batches; returns the totals.
+
+    The totals dict has the number of batches and operations, the inserted,
+    matched, modified and upserted counts, failed operations ('errors') and
+    the time spent writing ('seconds').
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    totals = _empty_totals()
+    batch = []
+    for operation in operations:
+        batch.append(operation)
+        if len(batch) >= batch_size:
+            await _write_batch(collection, batch, ordered, totals)
+            batch = []
+    if batch:
+        await _write_batch(collection, batch, ordered, totals)
+
+    if totals['batches']:
+        rate = totals['operations'] / totals['seconds'] if totals['seconds'] else 0
+        logger.info(f"{collection.name}: {totals['operations']} operations in {totals['batches']} batches, "
+                    f"{totals['seconds']:.2f}s ({rate:,.0f} ops/s), {totals['errors']} errors")
+    return totals
+
+
+async def bulk_upsert(collection, updates, batch_size=DEFAULT_BATCH_SIZE, ordered=False):
+    """Upsert (filter, update) pairs in batches; see bulk_write."""
+    operations = (UpdateOne(query, update, upsert=True) for query, update in updates)
+    return await bulk_write(collection, operations, batch_size=batch_size, ordered=ordered)
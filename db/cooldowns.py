@@ -0,0 +1,41 @@
+"""Atomic cooldown claims for per-user reward commands.
+
+A reward is claimed by one conditional update: the filter only matches when
+the user's cooldown has expired, and the update starts the next one. Two
+concurrent claims can therefore never both succeed, and no read-modify-write
+window exists between the check and the update.
+"""
+
+from pymongo import ReturnDocument
+
+
+async def claim_cooldown(collection, user_id, ready, update, new_doc):
+    """Apply `update` to the user's document if it matches `ready`.
+
+    `ready` is the filter for "cooldown expired" and `update` starts the next
+    cooldown (an update document or pipeline). Users without a document get
+    `new_doc` inserted. Returns (document, claimed): the updated document and
+    True, or the current document and False while the cooldown is running.
+    """
+    user_id = str(user_id)
+    doc = await collection.find_one_and_update(
+        {'user_id': user_id, **ready},
+        update,
+        return_document=ReturnDocument.AFTER
+    )
+    if doc is not None:
+        return doc, True
+
+    existing = await collection.find_one({'user_id': user_id})
+    if existing is not None:
+        return existing, False
+
+    # First claim ever. If another claim inserts the user first, this one lost the race.
+    result = await collection.update_one(
+        {'user_id': user_id},
+        {'$setOnInsert': new_doc},
+        upsert=True
+    )
+    if result.upserted_id is None:
+        return await collection.find_one({'user_id': user_id}), False
+    return dict(new_doc, user_id=user_id), True
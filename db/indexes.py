@@ -0,0 +1,162 @@
+"""Index bootstrap and schema checks for the aura database.
+
+`bootstrap()` runs once at startup (see bot.setup_hook). It:
+
+- creates the indexes in INDEXES; creating an index that already exists is a no-op
+- optionally installs the JSON-schema validators in SCHEMAS
+- explains the bot's hot queries and logs any that would scan a whole collection
+
+The unique `user_id` indexes are partial (only documents that have a
+`user_id`), because some collections also hold a single settings document
+keyed by `_id` (see scripts/migrate_admins.py).
+"""
+
+import logging
+
+from pymongo import ASCENDING, DESCENDING
+
+from db.mongo import db
+from db.user_names import NAME_TTL
+
+logger = logging.getLogger('aura_indexes')
+
+_HAS_USER_ID = {'user_id': {'$exists': True}}
+
+
+def _unique_user_id():
+    return {'keys': [('user_id', ASCENDING)], 'name': 'user_id_unique', 'unique': True,
+            'partialFilterExpression': _HAS_USER_ID}
+
+
+# collection name -> index specs
+INDEXES = {
+    'aura_points': [
+        _unique_user_id(),
+        # Covers the leaderboard ranking (sorted by points, projecting user_id) without touching documents.
+        {'keys': [('points', DESCENDING), ('user_id', ASCENDING)], 'name': 'points_desc_user_id'},
+    ],
+    'aura_data': [_unique_user_id()],
+    'last_used': [_unique_user_id()],
+    'admins': [_unique_user_id()],
+    'authorized_users': [_unique_user_id()],
+    'user_names': [
+        _unique_user_id(),
+        {'keys': [('updated_at', ASCENDING)], 'name': 'updated_at_ttl', 'expireAfterSeconds': NAME_TTL},
+    ],
+}
+
+# collection name -> $jsonSchema, only installed when bootstrap(validation=...) is set
+SCHEMAS = {
+    'aura_points': {
+        'bsonType': 'object',
+        'required': ['user_id', 'points'],
+        'properties': {
+            'user_id': {'bsonType': 'string'},
+            'points': {'bsonType': ['int', 'long', 'double']},
+        },
+    },
+    'aura_data': {
+        'bsonType': 'object',
+        'required': ['user_id'],
+        'properties': {
+            'user_id': {'bsonType': 'string'},
+            'streak': {'bsonType': ['int', 'long'], 'minimum': 0},
+            'last_claim': {'bsonType': ['string', 'null']},
+            'last_claim_timestamp': {'bsonType': ['double', 'int', 'long', 'null']},
+        },
+    },
+    'last_used': {
+        'bsonType': 'object',
+        'required': ['user_id', 'last_used'],
+        'properties': {
+            'user_id': {'bsonType': 'string'},
+            'last_used': {'bsonType': ['date', 'null']},
+        },
+    },
+}
+
+# (collection name, filter, sort) for the queries every command depends on
+HOT_QUERIES = [
+    ('aura_points', {'user_id': '0'}, None),
+    ('aura_points', {}, [('points', DESCENDING)]),
+    ('aura_data', {'user_id': '0'}, None),
+    ('last_used', {'user_id': '0'}, None),
+    ('admins', {'user_id': '0'}, None),
+    ('authorized_users', {'user_id': '0'}, None),
+]
+
+
+async def ensure_indexes(database=db):
+    for name, specs in INDEXES.items():
+        for spec in specs:
+            options = {k: v for k, v in spec.items() if k != 'keys'}
+            try:
+                await database[name].create_index(spec['keys'], **options)
+            except Exception as e:
+                logger.error(f"Error creating index {spec.get('name')} on {name}: {e}")
+
+
+async def apply_validators(database=db, action='warn'):
+    """Install SCHEMAS with the given validationAction ('warn' or 'error').
+
+    Validation level is 'moderate', so documents that are already invalid
+    can still be updated; only new or valid documents are checked.
+    """
+    existing = set(await database.list_collection_names())
+    for name, schema in SCHEMAS.items():
+        options = {'validator': {'$jsonSchema': schema}, 'validationLevel': 'moderate',
+                   'validationAction': action}
+        try:
+            if name in existing:
+                await database.command('collMod', name, **options)
+            else:
+                await database.create_collection(name, **options)
+        except Exception as e:
+            logger.error(f"Error applying schema validator to {name}: {e}")
+
+
+def _plan_stages(plan):
+    """Every stage name in an explain() plan tree."""
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            yield plan['stage']
+        for value in plan.values():
+            yield from _plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _plan_stages(value)
+
+
+async def check_query_plans(database=db):
+    """Explain HOT_QUERIES; returns the ones whose winning plan is a COLLSCAN."""
+    scans = []
+    for name, query, sort in HOT_QUERIES:
+        cursor = database[name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explain = await cursor.explain()
+        except Exception as e:
+            logger.error(f"Error explaining query {query} on {name}: {e}")
+            continue
+        stages = set(_plan_stages(explain.get('queryPlanner', {}).get('winningPlan', {})))
+        if 'COLLSCAN' in stages:
+            logger.warning(f"Query {query} (sort {sort}) on {name} does a collection scan")
+            scans.append((name, query, sort))
+        elif 'SORT' in stages:
+            logger.warning(f"Query {query} (sort {sort}) on {name} sorts in memory")
+    return scans
+
+
+async def bootstrap(database=db, validation=None):
+    """Create indexes, optionally install validators, then check the hot query plans.
+
+    `validation` is None (leave validators alone), 'warn' or 'error'.
+    """
+    await ensure_indexes(database)
+    if validation:
+        await apply_validators(database, action=validation)
+    scans = await check_query_plans(database)
+    logger.info(f"Database bootstrap done: {sum(len(s) for s in INDEXES.values())} indexes ensured, "
+                f"{len(scans)} hot queries scanning collections")
+    return scans
@@ -0,0 +1,181 @@
+"""The aura points ledger.
+
+Every balance read and change in the bot goes through `ledger`, which is
+backed by aura_points_collection ({'user_id': str, 'points': int}). Changes
+are atomic `$inc` updates, so concurrent commands never lose points. Balances
+are also kept in a small read-through cache. The bot is the only writer, and
+every write goes through here and refreshes the cache, so cached values stay
+current; the TTL only bounds how long a change made outside the bot (a
+migration script, a manual fix) can go unnoticed.
+
+Cogs that need to react to balance changes (the leaderboard, role rewards)
+register a callback with add_listener instead of polling the collection.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+
+from pymongo import ReturnDocument
+
+from db.mongo import aura_points_collection
+
+logger = logging.getLogger('aura_ledger')
+
+
+class AuraLedger:
+    def __init__(self, collection, cache_size=10000, cache_ttl=300):
+        self.collection = collection
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()  # user_id -> (points, cached_at)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call `callback(user_id, points)` after every balance change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def invalidate(self, user_id=None):
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(user_id), None)
+
+    def _cached(self, user_id):
+        entry = self._cache.get(user_id)
+        if entry is None or time.monotonic() - entry[1] > self.cache_ttl:
+            return None
+        self._cache.move_to_end(user_id)
+        return entry[0]
+
+    def _remember(self, user_id, points):
+        self._cache[user_id] = (points, time.monotonic())
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _changed(self, user_id, points):
+        self._remember(user_id, points)
+        for callback in list(self._listeners):
+            try:
+                callback(user_id, points)
+            except Exception as e:
+                logger.error(f"Error in ledger listener {callback}: {e}")
+
+    async def get(self, user_id):
+        """A user's balance; users without a document have 0 points."""
+        user_id = str(user_id)
+        points = self._cached(user_id)
+        if points is not None:
+            return points
+        doc = await self.collection.find_one({'user_id': user_id}, {'_id': 0, 'points': 1})
+        points = doc.get('points', 0) if doc else 0
+        self._remember(user_id, points)
+        return points
+
+    async def bulk_get(self, user_ids):
+        """Balances for many users in at most one query, as {user_id: points}."""
+        balances = {}
+        missing = []
+        for user_id in map(str, user_ids):
+            points = self._cached(user_id)
+            if points is None:
+                missing.append(user_id)
+            else:
+                balances[user_id] = points
+
+        if missing:
+            found = {}
+            async for doc in self.collection.find({'user_id': {'$in': missing}}, {'_id': 0, 'user_id': 1, 'points': 1}):
+                found[doc['user_id']] = doc.get('points', 0)
+            for user_id in missing:
+                balances[user_id] = found.get(user_id, 0)
+                self._remember(user_id, balances[user_id])
+        return balances
+
+    async def ranking(self):
+        """Every balance as (user_id, points), highest first."""
+        ranked = []
+        cursor = self.collection.find({}, {'_id': 0, 'user_id': 1, 'points': 1}).sort('points', -1)
+        async for doc in cursor:
+            if 'user_id' in doc:
+                ranked.append((doc['user_id'], doc.get('points', 0)))
+        return ranked
+
+    async def add(self, user_id, amount):
+        """Add `amount` (may be negative) to a user's balance; returns the new balance."""
+        user_id = str(user_id)
+        doc = await self.collection.find_one_and_update(
+            {'user_id': user_id},
+            {'$inc': {'points': amount}},
+            projection={'_id': 0, 'points': 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self._changed(user_id, doc['points'])
+        return doc['points']
+
+    async def debit(self, user_id, amount):
+        """Take `amount` from a user only if they have at least that much.
+
+        Returns the new balance, or None (and changes nothing) if they don't.
+        """
+        user_id = str(user_id)
+        doc = await self.collection.find_one_and_update(
+            {'user_id': user_id, 'points': {'$gte': amount}},
+            {'$inc': {'points': -amount}},
+            projection={'_id': 0, 'points': 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if doc is None:
+            self.invalidate(user_id)
+            return None
+        self._changed(user_id, doc['points'])
+        return doc['points']
+
+    async def reset(self, user_id):
+        """Set an existing user's balance to 0; returns the old balance or None."""
+        user_id = str(user_id)
+        doc = await self.collection.find_one_and_update(
+            {'user_id': user_id},
+            {'$set': {'points': 0}},
+            projection={'_id': 0, 'points': 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if doc is None:
+            return None
+        self._changed(user_id, 0)
+        return doc.get('points', 0)
+
+    async def transfer(self, from_user_id, to_user_id, amount):
+        """Move `amount` points between users in two round trips.
+
+        The debit is a single conditional `$inc` (`points >= amount`), so the
+        balance check can't race with another transfer and the sender can
+        never go negative. The credit is an upserted `$inc`; if it fails the
+        debit is refunded. Points are never created, and only briefly in
+        flight between the two updates. Returns (sender balance, recipient
+        balance), or None if the sender doesn't have enough points.
+        """
+        if amount <= 0:
+            raise ValueError(f"Transfer amount must be positive, got {amount}")
+        if str(from_user_id) == str(to_user_id):
+            raise ValueError("Cannot transfer points to the same user")
+
+        from_balance = await self.debit(from_user_id, amount)
+        if from_balance is None:
+            return None
+        try:
+            to_balance = await self.add(to_user_id, amount)
+        except Exception as e:
+            logger.error(f"Credit of {amount} to {to_user_id} failed ({e}); refunding {from_user_id}")
+            await self.add(from_user_id, amount)
+            raise
+        return from_balance, to_balance
+
+
+ledger = AuraLedger(aura_points_collection)
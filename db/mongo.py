@@ -12,4 +12,6 @@ admins_collection = db['admins']  # Ensure this matches the collection used for
 custom_commands_collection = db['custom_commands']
 authorized_users_collection = db['authorized_users']
 aura_data_collection = db['aura_data']
-characters_collection = db['characters']  # Ensure characters collection is available
\ No newline at end of file
+characters_collection = db['characters']  # Ensure characters collection is available
+transactions_collection = db['transactions']
+user_names_collection = db['user_names']  # name cache for users outside the member cache
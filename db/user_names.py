@@ -0,0 +1,118 @@
+"""Display names for users who may not be in the bot's member cache.
+
+Leaderboards show users from every guild, and most of them aren't cached, so
+naming them used to mean one `fetch_user` REST call each, one after another.
+`user_names.resolve(bot, user_ids)` looks names up in order:
+1. an in-memory LRU
+2. the gateway cache (`bot.get_user`)
+3. the Mongo `user_names` collection, in one `$in` query; a TTL index
+   expires its documents (see db/indexes.py)
+Only what's left is fetched over REST, concurrently, at most `concurrency`
+at a time. Fetched names are written back in one bulk upsert.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+import discord
+
+from db.bulk import bulk_upsert
+from db.mongo import user_names_collection
+
+logger = logging.getLogger('aura_user_names')
+
+NAME_TTL = 7 * 24 * 3600  # seconds; also the Mongo TTL index's expireAfterSeconds
+
+
+class UserNameResolver:
+    def __init__(self, collection, cache_size=10000, ttl=NAME_TTL, concurrency=5, max_fetches=10):
+        self.collection = collection
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.max_fetches = max_fetches
+        self._cache = OrderedDict()  # user_id -> (name, cached_at)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_limited_until = 0.0
+
+    def _cached(self, user_id):
+        entry = self._cache.get(user_id)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        self._cache.move_to_end(user_id)
+        return entry[0]
+
+    def _remember(self, user_id, name):
+        self._cache[user_id] = (name, time.monotonic())
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _fetch(self, bot, user_id):
+        if time.monotonic() < self._rate_limited_until:
+            return None
+        async with self._semaphore:
+            try:
+                user = await bot.fetch_user(int(user_id))
+            except discord.NotFound:
+                return None
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    # Back off instead of queueing more requests behind the limit.
+                    retry_after = getattr(e, 'retry_after', None) or 5
+                    self._rate_limited_until = time.monotonic() + retry_after
+                    logger.warning(f"Rate limited fetching users, pausing fetches for {retry_after}s")
+                else:
+                    logger.error(f"Error fetching user {user_id}: {e}")
+                return None
+        return user.name
+
+    async def resolve(self, bot, user_ids):
+        """Names for the given users as {user_id: name}; unknown users are left out."""
+        names = {}
+        missing = []
+        for user_id in dict.fromkeys(map(str, user_ids)):
+            name = self._cached(user_id)
+            if name is None:
+                user = bot.get_user(int(user_id))
+                if user is not None:
+                    name = user.name
+                    self._remember(user_id, name)
+            if name is None:
+                missing.append(user_id)
+            else:
+                names[user_id] = name
+
+        if missing:
+            try:
+                cursor = self.collection.find({'user_id': {'$in': missing}}, {'_id': 0, 'user_id': 1, 'name': 1})
+                async for doc in cursor:
+                    names[doc['user_id']] = doc['name']
+                    self._remember(doc['user_id'], doc['name'])
+            except Exception as e:
+                logger.error(f"Error reading cached user names: {e}")
+            missing = [user_id for user_id in missing if user_id not in names]
+
+        if missing:
+            to_fetch = missing[:self.max_fetches]
+            results = await asyncio.gather(*(self._fetch(bot, user_id) for user_id in to_fetch))
+            fetched = {user_id: name for user_id, name in zip(to_fetch, results) if name is not None}
+            for user_id, name in fetched.items():
+                names[user_id] = name
+                self._remember(user_id, name)
+            if fetched:
+                now = datetime.utcnow()
+                try:
+                    await bulk_upsert(
+                        self.collection,
+                        (({'user_id': user_id}, {'$set': {'name': name, 'updated_at': now}})
+                         for user_id, name in fetched.items())
+                    )
+                except Exception as e:
+                    logger.error(f"Error saving user names: {e}")
+        return names
+
+
+user_names = UserNameResolver(user_names_collection)
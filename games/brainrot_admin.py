@@ -1,71 +1,31 @@
 import discord
 from discord.ext import commands
 import json
-import os   
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Optional
+from . import collection_store
+from .catalog import catalog
+from .journal import journal
+from db.authorization import authorization, GAME_ADMINS
 
 class BrainrotAdmin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('brainrot_admin')
-        self.admin_users = self.load_admin_users()
-        self.logger.info(f"BrainrotAdmin initialized with admins: {self.admin_users}")
-
-    def load_admin_users(self) -> List[str]:
-        try:
-            with open('authorized_users.json', 'r') as f:
-                data = json.load(f)
-                return data.get('authorized_user_ids', [])
-        except Exception as e:
-            self.logger.error(f"Error loading authorized users: {e}")
-            return []
 
     async def cog_check(self, ctx):
-        user_id = str(ctx.author.id)
-        self.logger.debug(f"Admin command attempt by {ctx.author} ({user_id})")
-        self.logger.debug(f"Admin list: {self.admin_users}")
-        
-        is_admin = user_id in self.admin_users
-        return is_admin
-
-    def load_user_data(self):
-        try:
-            os.makedirs('data', exist_okay=True)
-            file_path = 'data/users.json'
-            
-            if not os.path.exists(file_path):
-                default_data = {"users": {}}
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_data, f, indent=2)
-                return default_data
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading user data: {e}")
-            return {"users": {}}
+        self.logger.debug(f"Admin command attempt by {ctx.author} ({ctx.author.id})")
+        return await authorization.is_admin(ctx.author.id, GAME_ADMINS)
 
-    def save_user_data(self, data):
-        try:
-            os.makedirs('data', exist_ok=True)
-            with open('data/users.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            self.logger.info("User data successfully saved.")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error saving user data: {e}")
-            return False
+    async def cog_load(self):
+        self.collections = await collection_store.attach(self.bot)
 
     @commands.command(name="adminreset")
     async def reset_all(self, ctx):
         try:
-            data = {"users": {}}
-            if self.save_user_data(data):
-                await self.send_success(ctx, "Successfully reset all user data!", "All user data has been reset.")
-            else:
-                await self.send_error(ctx, "Error occurred while resetting data!", "An error occurred while processing the command.")
+            await self.collections.reset_all()
+            await self.send_success(ctx, "Successfully reset all user data!", "All user data has been reset.")
         except Exception as e:
             self.logger.error(f"Error in reset_all: {e}")
             await self.send_error(ctx, "An error occurred while processing the command!", "An error occurred while processing the command.")
@@ -73,16 +33,8 @@ class BrainrotAdmin(commands.Cog):
     @commands.command(name="resetuser")
     async def reset_user(self, ctx, user_id: str):
         try:
-            data = self.load_user_data()
-            if user_id in data["users"]:
-                data["users"][user_id] = {
-                    "last_claim": None,
-                    "claimed_characters": []
-                }
-                if self.save_user_data(data):
-                    await self.send_success(ctx, f"Successfully reset data for user {user_id}", "Data reset for user " + user_id)
-                else:
-                    await self.send_error(ctx, "Error occurred while saving data!", "An error occurred while saving data.")
+            if await self.collections.reset_user(user_id):
+                await self.send_success(ctx, f"Successfully reset data for user {user_id}", "Data reset for user " + user_id)
             else:
                 await self.send_error(ctx, "User not found in database!", "Attempted to reset non-existent user " + user_id)
         except Exception as e:
@@ -92,9 +44,9 @@ class BrainrotAdmin(commands.Cog):
     @commands.command(name="dropstats")
     async def view_stats(self, ctx):
         try:
-            data = self.load_user_data()
-            total_users = len(data["users"])
-            total_claims = sum(len(u["claimed_characters"]) for u in data["users"].values())
+            stats = await self.collections.stats()
+            total_users = stats["users"]
+            total_claims = stats["claims"]
             
             embed = discord.Embed(
                 title="📊 Brainrot Drop Statistics",
@@ -115,27 +67,95 @@ class BrainrotAdmin(commands.Cog):
             self.logger.error(f"Error in view_stats: {e}")
             await self.send_error(ctx, "An error occurred while retrieving statistics!", "An error occurred while retrieving statistics.")
 
+    @commands.command(name="salesreport")
+    async def sales_report(self, ctx, days: int = 7):
+        """Summarize card sales over the last `days` days from the sales journal."""
+        try:
+            since = datetime.now() - timedelta(days=max(days, 1))
+            sales = cards = points = 0
+            sellers = {}
+            async with ctx.typing():
+                await journal.flush()
+                async for entry in journal.read(since=since):
+                    sales += 1
+                    cards += entry.get('count', 0)
+                    points += entry.get('points', 0)
+                    sellers[entry['user_id']] = sellers.get(entry['user_id'], 0) + entry.get('points', 0)
+
+            top = sorted(sellers.items(), key=lambda item: item[1], reverse=True)[:5]
+            embed = discord.Embed(
+                title=f"💰 Sales in the last {days} days",
+                color=discord.Color.blue(),
+                timestamp=datetime.now()
+            )
+            embed.add_field(
+                name="Overview",
+                value=f"```• Sales: {sales:,}\n• Cards Sold: {cards:,}\n• Points Paid: {points:,}```",
+                inline=False
+            )
+            if top:
+                embed.add_field(
+                    name="Top Sellers",
+                    value="\n".join(f"<@{user_id}>: {total:,} points" for user_id, total in top),
+                    inline=False
+                )
+            embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+        except Exception as e:
+            self.logger.error(f"Error in sales_report: {e}")
+            await self.send_error(ctx, "An error occurred while building the sales report!", "An error occurred while building the sales report.")
+
     @commands.command(name="refreshadmin")
     async def refresh_admins(self, ctx):
         try:
-            self.admin_users = self.load_admin_users()
+            if not await authorization.refresh():
+                await self.send_error(ctx, "Failed to refresh admin users!", "The admin lists could not be loaded; the previous lists are still in use.")
+                return
             await self.send_success(ctx, "Admin users list refreshed!", "Admin users list has been refreshed.")
         except Exception as e:
             self.logger.error(f"Error refreshing admin users: {e}")
             await self.send_error(ctx, "An error occurred while refreshing admin users!", "An error occurred while refreshing admin users.")
 
+    @commands.command(name="prerender_cards")
+    async def prerender_cards(self, ctx):
+        drop_cog = self.bot.get_cog('BrainrotDrop')
+        if not drop_cog:
+            await self.send_error(ctx, "Drop system is not loaded!", "BrainrotDrop cog is unavailable.")
+            return
+        try:
+            async with ctx.typing():
+                stats = await drop_cog.prerender_cards()
+            await self.send_success(
+                ctx,
+                "Card cache warmed!",
+                f"Characters: {stats['total']}\nRendered: {stats['rendered']}\n"
+                f"Failed: {stats['failed']}\nStale cards removed: {stats['pruned']}"
+            )
+        except Exception as e:
+            self.logger.error(f"Error prerendering cards: {e}")
+            await self.send_error(ctx, "An error occurred while prerendering cards!", "An error occurred while prerendering cards.")
+
+    @commands.command(name="reload_catalog")
+    async def reload_catalog(self, ctx, sync: Optional[bool] = False):
+        """Reload data/characters.json now; `sync` also mirrors it into the characters collection."""
+        try:
+            if not catalog.load():
+                await self.send_error(ctx, "Catalog reload failed!", "The character file could not be read; the old catalog is still in use.")
+                return
+            description = f"Characters: {len(catalog)}\nTypes: {', '.join(catalog.types())}"
+            if sync:
+                totals = await catalog.sync_to_db()
+                description += f"\nSynced to database: {totals['operations']} ({totals['errors']} errors)"
+            await self.send_success(ctx, "Character catalog reloaded!", description)
+        except Exception as e:
+            self.logger.error(f"Error reloading catalog: {e}")
+            await self.send_error(ctx, "An error occurred while reloading the catalog!", "An error occurred while reloading the catalog.")
+
     @commands.command(name="clearcooldown")
     @commands.has_permissions(administrator=True)
     async def clear_cooldown(self, ctx, user: discord.User):
         try:
-            with open('data/users.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            user_id = str(user.id)
-            if user_id in data["users"]:
-                data["users"][user_id]["last_claim"] = None
-                with open('data/users.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+            if await self.collections.clear_cooldown(user.id):
                 await ctx.send(f"Cooldown cleared for {user.mention}.")
             else:
                 await ctx.send(f"User {user.mention} not found in the database.")
@@ -146,7 +166,7 @@ class BrainrotAdmin(commands.Cog):
     @commands.command(name="backupdata")
     async def backup(self, ctx):
         try:
-            data = self.load_user_data()
+            data = {"users": await self.collections.snapshot()}
             backup_path = f'data/backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
             
             with open(backup_path, 'w', encoding='utf-8') as f:
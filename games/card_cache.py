@@ -0,0 +1,123 @@
+"""Content-addressed cache of rendered character cards.
+
+A card is fully determined by its character record, the render template and
+the fonts, so the cache key is a hash of exactly those inputs. Editing a
+character in data/characters.json (or bumping render.TEMPLATE_VERSION)
+produces a new key, which invalidates the old card without any bookkeeping.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from . import config, render
+
+
+def _font_fingerprint():
+    """Identify the font files the renderer will actually pick up."""
+    parts = []
+    for font_type, paths in sorted(config.FONT_PATHS.items()):
+        for path in paths:
+            if os.path.exists(path):
+                stat = os.stat(path)
+                parts.append(f"{font_type}:{os.path.basename(path)}:{stat.st_size}")
+                break
+    return '|'.join(parts)
+
+
+class CardCache:
+    def __init__(self, directory=None, memory_items=None):
+        settings = config.GAME_SETTINGS['card_cache']
+        self.directory = Path(directory or settings['directory'])
+        self.memory_items = memory_items or settings['memory_items']
+        self.logger = logging.getLogger('brainrot_card_cache')
+        self.fonts = _font_fingerprint()
+
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, character, card_width, card_height):
+        """Hash of every input that affects the rendered card."""
+        payload = json.dumps({
+            'character': character,
+            'template': render.TEMPLATE_VERSION,
+            'fonts': self.fonts,
+            'size': [card_width, card_height],
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f'{key}.png'
+
+    def _remember(self, key, data):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    async def get(self, key):
+        """Return cached PNG bytes for a key, or None."""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return data
+
+        path = self._path(key)
+        data = await asyncio.to_thread(self._read, path)
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._remember(key, data)
+        return data
+
+    async def put(self, key, data):
+        self._remember(key, data)
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    def contains(self, key):
+        return key in self._memory or self._path(key).exists()
+
+    def _read(self, path):
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading cached card {path}: {e}")
+            return None
+
+    def _write(self, path, data):
+        temp_path = path.with_suffix('.tmp')
+        try:
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+        except Exception as e:
+            self.logger.error(f"Error writing cached card {path}: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def prune(self, valid_keys):
+        """Drop disk and memory entries whose character record no longer exists."""
+        valid_keys = set(valid_keys)
+        removed = 0
+        for path in self.directory.glob('*.png'):
+            if path.stem not in valid_keys:
+                try:
+                    path.unlink()
+                    removed += 1
+                except Exception as e:
+                    self.logger.error(f"Error removing stale card {path}: {e}")
+        for key in [k for k in self._memory if k not in valid_keys]:
+            del self._memory[key]
+        return removed
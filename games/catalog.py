@@ -0,0 +1,128 @@
+"""The character catalog for the drop game.
+
+data/characters.json is read once into memory and indexed by id and by type,
+so card lookups are dict lookups and picking a character of a given type is a
+single random.choice. The file's mtime is checked at most every
+`check_interval` seconds, and an edited file is picked up without a restart.
+`.reload_catalog` forces a reload. Every games cog shares the one `catalog`.
+"""
+
+import json
+import logging
+import os
+import random
+import time
+
+from pymongo import ReplaceOne
+
+from db.bulk import bulk_write
+from db.mongo import characters_collection
+from . import config
+
+REQUIRED_FIELDS = ('id', 'name', 'type', 'image_url')
+
+
+def validate_character(character):
+    return all(field in character for field in REQUIRED_FIELDS)
+
+
+class CharacterCatalog:
+    def __init__(self, path, check_interval=30):
+        self.path = path
+        self.check_interval = check_interval
+        self.logger = logging.getLogger('brainrot_catalog')
+        self.version = 0  # bumped on every successful load
+        self._characters = []
+        self._by_id = {}
+        self._by_type = {}
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def __len__(self):
+        self._maybe_reload()
+        return len(self._characters)
+
+    def load(self):
+        """(Re)read the file. On error the previous catalog is kept and False returned."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)['characters']
+        except Exception as e:
+            self.logger.error(f"Error loading character catalog from {self.path}: {e}")
+            return False
+
+        characters, by_id, by_type = [], {}, {}
+        for character in raw:
+            if not validate_character(character):
+                self.logger.warning(f"Skipping invalid character: {character}")
+                continue
+            character = dict(character, id=str(character['id']))
+            characters.append(character)
+            by_id[character['id']] = character
+            by_type.setdefault(character['type'], []).append(character)
+
+        self._characters, self._by_id, self._by_type = characters, by_id, by_type
+        self._mtime = mtime
+        self._checked_at = time.monotonic()
+        self.version += 1
+        self.logger.info(f"Loaded {len(characters)} characters "
+                         f"({', '.join(f'{t}: {len(c)}' for t, c in by_type.items())})")
+        return True
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if self._mtime is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            if self._mtime is None:
+                self.logger.error(f"Character catalog {self.path} is missing: {e}")
+            return
+        if mtime != self._mtime:
+            self.load()
+
+    def get(self, card_id):
+        self._maybe_reload()
+        return self._by_id.get(str(card_id))
+
+    def get_many(self, card_ids):
+        """Characters for the given ids, keyed by id; unknown ids are left out."""
+        self._maybe_reload()
+        return {str(card_id): self._by_id[str(card_id)] for card_id in card_ids if str(card_id) in self._by_id}
+
+    def all(self):
+        self._maybe_reload()
+        return list(self._characters)
+
+    def of_type(self, card_type):
+        self._maybe_reload()
+        return self._by_type.get(card_type, [])
+
+    def types(self):
+        self._maybe_reload()
+        return list(self._by_type)
+
+    def random_of_type(self, card_type, excluded_ids=()):
+        """A random character of the type, not in excluded_ids, or None."""
+        characters = self.of_type(card_type)
+        # Exclusions are a couple of cards per drop, so rejection sampling
+        # almost always succeeds on the first draw.
+        for _ in range(8):
+            if not characters:
+                return None
+            character = random.choice(characters)
+            if character['id'] not in excluded_ids:
+                return character
+        remaining = [c for c in characters if c['id'] not in excluded_ids]
+        return random.choice(remaining) if remaining else None
+
+    async def sync_to_db(self, collection=characters_collection):
+        """Write the catalog to the characters collection so it mirrors the file."""
+        operations = (ReplaceOne({'id': c['id']}, dict(c), upsert=True) for c in self.all())
+        return await bulk_write(collection, operations)
+
+
+catalog = CharacterCatalog(**config.GAME_SETTINGS['catalog'])
@@ -0,0 +1,207 @@
+"""Card collections and claim cooldowns for the drop game.
+
+Everything lives in MongoDB (see db/mongo.py). Each user is one document in
+`users_collection`:
+
+    {'user_id': '123', 'last_claim': '2024-11-06T18:34:41', 'claimed_characters': {'001': 2}}
+
+Claims and sales are single atomic updates that `$inc` the one card they
+touch, so concurrent drops and sales can never overwrite each other. The
+store is shared by every games cog through `bot.collection_store` (see attach).
+
+Every write that changes a user's cards bumps an in-process version for that
+user (see version), so views that cache a collection can tell when it is stale
+without reading it again. The bot is the only writer of this collection.
+"""
+
+import logging
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from db.mongo import users_collection, characters_collection
+
+
+def _card_path(card_id):
+    return f"claimed_characters.{card_id}"
+
+
+class CollectionStore:
+    def __init__(self, users=None, characters=None):
+        self.users = users if users is not None else users_collection
+        self.characters = characters if characters is not None else characters_collection
+        self.logger = logging.getLogger('brainrot_collections')
+        self._started = False
+        self._indexed = False  # the unique user_id index exists; claims rely on it
+        self._versions = {}  # user_id -> number of card changes seen
+        self._epoch = 0  # bumped by reset_all
+
+    async def start(self):
+        """Create the indexes the queries below rely on (once per process).
+
+        Raises if the unique user_id index can't be built (e.g. old data has
+        duplicate users): without it a user could end up with two documents,
+        so claims are refused until it exists.
+        """
+        if self._started:
+            return
+        try:
+            await self.users.create_index([('user_id', ASCENDING)], unique=True)
+        except Exception as e:
+            self.logger.error(f"Error creating the unique user_id index, claims are disabled: {e}")
+            raise
+        self._indexed = True
+        self._started = True
+        try:
+            await self.characters.create_index([('id', ASCENDING)], unique=True)
+            await self.characters.create_index([('type', ASCENDING)])
+        except Exception as e:
+            self.logger.error(f"Error creating collection indexes: {e}")
+
+    def version(self, user_id):
+        """A value that changes whenever the user's cards change in this process."""
+        return (self._epoch, self._versions.get(str(user_id), 0))
+
+    def _bump(self, user_id):
+        user_id = str(user_id)
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    async def get_user(self, user_id):
+        """A user's record, or None if they have never claimed."""
+        return await self.users.find_one({'user_id': str(user_id)}, {'_id': 0})
+
+    async def get_collection(self, user_id):
+        """A user's {card id: count} map."""
+        user = await self.users.find_one({'user_id': str(user_id)}, {'_id': 0, 'claimed_characters': 1})
+        return user.get('claimed_characters', {}) if user else {}
+
+    async def record_claim(self, user_id, card_id, claimed_at, cooldown_start=None):
+        """Add one card to a user's collection and start their cooldown.
+
+        If `cooldown_start` is given, the claim only goes through when the
+        user's last claim is at or before it; otherwise returns None. On
+        success returns how many of that card the user now owns.
+        """
+        if not self._indexed:
+            raise RuntimeError("The unique user_id index is missing; refusing claims")
+        user_id = str(user_id)
+        card_id = str(card_id)
+        query = {'user_id': user_id}
+        if cooldown_start is not None:
+            query['$or'] = [{'last_claim': None}, {'last_claim': {'$lte': cooldown_start}}]
+
+        user = await self._claim(query, card_id, claimed_at)
+        if user is None:
+            # Either the user has no document yet or they are still on cooldown.
+            # The claim itself never upserts, so create the document and retry once.
+            await self._ensure_user(user_id)
+            user = await self._claim(query, card_id, claimed_at)
+            if user is None:
+                return None
+        self._bump(user_id)
+        return user['claimed_characters'][card_id]
+
+    async def _claim(self, query, card_id, claimed_at):
+        return await self.users.find_one_and_update(
+            query,
+            {'$inc': {_card_path(card_id): 1}, '$set': {'last_claim': claimed_at}},
+            projection={'_id': 0, _card_path(card_id): 1},
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _ensure_user(self, user_id):
+        """Create an empty document for the user unless they already have one."""
+        try:
+            await self.users.update_one(
+                {'user_id': user_id},
+                {'$setOnInsert': {'last_claim': None, 'claimed_characters': {}}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # Lost a race to create the user's document; it exists now.
+            pass
+
+    async def take_cards(self, user_id, counts):
+        """Take `counts` ({card id: count}) from a user in one atomic update.
+
+        Nothing changes unless the user owns at least that many of every
+        card. Returns the counts left, or None. Emptied stacks are removed.
+        """
+        counts = {str(card_id): count for card_id, count in counts.items() if count > 0}
+        if not counts:
+            return {}
+        query = {'user_id': str(user_id)}
+        query.update({_card_path(card_id): {'$gte': count} for card_id, count in counts.items()})
+        user = await self.users.find_one_and_update(
+            query,
+            {'$inc': {_card_path(card_id): -count for card_id, count in counts.items()}},
+            projection={'_id': 0, **{_card_path(card_id): 1 for card_id in counts}},
+            return_document=ReturnDocument.AFTER
+        )
+        if user is None:
+            return None
+
+        remaining = {card_id: user['claimed_characters'][card_id] for card_id in counts}
+        emptied = [card_id for card_id, left in remaining.items() if left == 0]
+        if emptied:
+            await self.users.update_one(
+                {'user_id': str(user_id), **{_card_path(card_id): 0 for card_id in emptied}},
+                {'$unset': {_card_path(card_id): '' for card_id in emptied}}
+            )
+        self._bump(user_id)
+        return remaining
+
+    async def give_cards(self, user_id, counts):
+        """Return cards to a user, e.g. to undo a sale that couldn't be paid."""
+        if counts:
+            await self.users.update_one(
+                {'user_id': str(user_id)},
+                {'$inc': {_card_path(card_id): count for card_id, count in counts.items()}},
+                upsert=True
+            )
+            self._bump(user_id)
+
+    async def clear_cooldown(self, user_id):
+        result = await self.users.update_one({'user_id': str(user_id)}, {'$set': {'last_claim': None}})
+        return result.matched_count == 1
+
+    async def reset_user(self, user_id):
+        result = await self.users.update_one(
+            {'user_id': str(user_id)},
+            {'$set': {'last_claim': None, 'claimed_characters': {}}}
+        )
+        self._bump(user_id)
+        return result.matched_count == 1
+
+    async def reset_all(self):
+        await self.users.delete_many({})
+        self._epoch += 1
+
+    async def stats(self):
+        """Number of users and of distinct cards claimed across all users."""
+        pipeline = [{'$group': {
+            '_id': None,
+            'users': {'$sum': 1},
+            'claims': {'$sum': {'$size': {'$objectToArray': {'$ifNull': ['$claimed_characters', {}]}}}}
+        }}]
+        result = await self.users.aggregate(pipeline).to_list(length=1)
+        if not result:
+            return {'users': 0, 'claims': 0}
+        return {'users': result[0]['users'], 'claims': result[0]['claims']}
+
+    async def snapshot(self):
+        """Every user's record, keyed by user id."""
+        users = {}
+        async for user in self.users.find({}, {'_id': 0}):
+            users[user['user_id']] = {k: v for k, v in user.items() if k != 'user_id'}
+        return users
+
+
+async def attach(bot):
+    """Return the bot's shared store, creating it on first use."""
+    store = getattr(bot, 'collection_store', None)
+    if store is None:
+        store = CollectionStore()
+        bot.collection_store = store
+    await store.start()
+    return store
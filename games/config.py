@@ -11,10 +11,36 @@ GAME_SETTINGS = {
         'normal': 0.80,
         'legendary': 0.15,
         'loser': 0.05
+    },
+    'guild_probabilities': {
+        # guild id -> overrides for some or all of 'probabilities', e.g.
+        # '123456789012345678': {'legendary': 0.25}
+    },
+    'render': {
+        'workers': 2,         # rendering processes
+        'max_queue': 16,      # jobs queued or running before submitters wait
+        'queue_wait': 10,     # seconds to wait for a queue slot before giving up
+        'job_timeout': 20,    # seconds a single render may take
+        'debug_output_dir': None  # e.g. 'output' to also write rendered PNGs to disk
+    },
+    'card_cache': {
+        'directory': 'data/card_cache',
+        'memory_items': 256   # rendered cards kept in memory (~50KB each)
+    },
+    'image_store': {
+        'directory': 'data/image_cache',
+        'memory_items': 128,        # fitted source images kept in memory
+        'revalidate_after': 86400,  # seconds before a cached image is rechecked upstream
+        'request_timeout': 10
+    },
+    'catalog': {
+        'path': 'data/characters.json',
+        'check_interval': 30  # seconds between checks of the file's mtime
     }
 }
 
 import os
+from functools import lru_cache
 from PIL import ImageFont
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,8 +66,12 @@ FONT_PATHS = {
     ]
 }
 
+@lru_cache(maxsize=128)
 def load_font(font_type: str, size: int) -> ImageFont.FreeTypeFont:
-    """Load a font, trying multiple paths and falling back to default if needed."""
+    """Load a font, trying multiple paths and falling back to default if needed.
+
+    Font handles are cached per (type, size); callers share them read-only.
+    """
     if font_type not in FONT_PATHS:
         return ImageFont.load_default()
         
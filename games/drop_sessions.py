@@ -0,0 +1,61 @@
+"""Bookkeeping for live card drops.
+
+Every drop message gets its own DropSession with a private claim queue, so
+concurrent drops in different channels never see each other's reactions.
+The drop cog routes raw reaction events to a session by message id, which is
+a single dict lookup no matter how many drops are open.
+"""
+
+import asyncio
+from datetime import datetime
+
+
+class DropSession:
+    def __init__(self, ctx, message, characters, end_time):
+        self.ctx = ctx
+        self.message = message
+        self.characters = characters
+        self.end_time = end_time
+        self.claimed = set()  # slot indexes already claimed
+        self.queue = asyncio.Queue()  # raw reaction payloads waiting to be processed
+
+    @property
+    def message_id(self):
+        return self.message.id
+
+    def remaining(self):
+        """Seconds left before the drop expires."""
+        return (self.end_time - datetime.now()).total_seconds()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+
+class DropSessionManager:
+    def __init__(self):
+        self._sessions = {}  # message id -> DropSession
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def open(self, ctx, message, characters, end_time):
+        session = DropSession(ctx, message, characters, end_time)
+        self._sessions[message.id] = session
+        return session
+
+    def get(self, message_id):
+        return self._sessions.get(message_id)
+
+    def close(self, message_id):
+        return self._sessions.pop(message_id, None)
+
+    def route(self, payload):
+        """Queue a raw reaction payload on its drop; returns the session or None."""
+        session = self._sessions.get(payload.message_id)
+        if session is None or session.expired():
+            return None
+        session.queue.put_nowait(payload)
+        return session
+
+    def clear(self):
+        self._sessions.clear()
@@ -0,0 +1,79 @@
+"""Gradient layers for the drop game cards.
+
+Every layer here is built with whole-image operations instead of per-pixel
+Python loops and is memoized by its size and card type. The returned images
+are shared between calls, so callers must copy them before drawing on them.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+SUBTLE_TOP_COLOR = (45, 49, 66, 255)
+SUBTLE_BOTTOM_COLOR = (28, 31, 42, 255)
+
+BORDER_GRADIENT_COLORS = {
+    'normal': ((114, 137, 218, 255), (78, 93, 148, 255)),
+    'legendary': ((255, 215, 0, 255), (218, 165, 32, 255)),
+    'loser': ((220, 20, 60, 255), (139, 0, 0, 255))
+}
+
+
+def _rows_to_image(mode: str, width: int, rows) -> Image.Image:
+    """Build an image whose every row is filled with a single pixel value."""
+    return Image.frombytes(mode, (width, len(rows)), b''.join(row * width for row in rows))
+
+
+@lru_cache(maxsize=16)
+def subtle_background_mask(width: int, height: int) -> Image.Image:
+    """Vertical 'L' mask that fades the subtle background towards its bottom color."""
+    rows = []
+    for y in range(height):
+        value = int(255 * (1.5 * y / height))
+        rows.append(bytes((min(255, max(0, value)),)))
+    return _rows_to_image('L', width, rows)
+
+
+@lru_cache(maxsize=16)
+def subtle_background(width: int, height: int) -> Image.Image:
+    """Dark gradient background shared by every card type."""
+    base = Image.new('RGBA', (width, height), SUBTLE_TOP_COLOR)
+    gradient = Image.new('RGBA', (width, height), SUBTLE_BOTTOM_COLOR)
+    return Image.composite(gradient, base, subtle_background_mask(width, height))
+
+
+@lru_cache(maxsize=32)
+def border_gradient(width: int, height: int, character_type: str) -> Image.Image:
+    """Opaque top-to-bottom gradient used behind the card border."""
+    gradient_top, gradient_bottom = BORDER_GRADIENT_COLORS.get(
+        character_type, BORDER_GRADIENT_COLORS['normal'])
+    rows = []
+    for y in range(height):
+        ratio = y / height
+        r = int(gradient_top[0] * (1 - ratio) + gradient_bottom[0] * ratio)
+        g = int(gradient_top[1] * (1 - ratio) + gradient_bottom[1] * ratio)
+        b = int(gradient_top[2] * (1 - ratio) + gradient_bottom[2] * ratio)
+        rows.append(bytes((r, g, b, 255)))
+    return _rows_to_image('RGBA', width, rows)
+
+
+@lru_cache(maxsize=16)
+def radial_gradient(size: Tuple[int, int], center_color: Tuple[int, int, int, int],
+                    edge_color: Tuple[int, int, int, int]) -> Image.Image:
+    """Radial RGBA gradient blending from center_color to edge_color at the corners."""
+    width, height = size
+    center_x, center_y = width / 2, height / 2
+    max_distance = ((width/2)**2 + (height/2)**2)**0.5
+
+    xs = (np.arange(width, dtype=np.float64) - center_x) ** 2
+    ys = (np.arange(height, dtype=np.float64) - center_y) ** 2
+    distance = np.sqrt(ys[:, None] + xs[None, :])
+    ratio = np.minimum(distance / max_distance, 1.0)
+
+    channels = [
+        (center_color[i] * (1 - ratio) + edge_color[i] * ratio).astype(np.uint8)
+        for i in range(4)
+    ]
+    return Image.fromarray(np.stack(channels, axis=-1))
@@ -0,0 +1,155 @@
+"""Character art store for the drop game.
+
+Source images are fetched through the bot's shared aiohttp session, decoded
+and fitted to the card's image area once, and then kept in an in-memory LRU.
+Raw downloads are also kept on disk by URL hash together with their
+ETag/Last-Modified validators, so a restart only costs a conditional request
+(usually a 304) instead of a full download. Concurrent requests for the same
+URL share a single fetch.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+import aiohttp
+from PIL import Image, ImageOps
+
+from . import config
+
+
+class ImageStore:
+    def __init__(self, session=None, directory=None, memory_items=None, revalidate_after=None):
+        settings = config.GAME_SETTINGS['image_store']
+        self.directory = Path(directory or settings['directory'])
+        self.memory_items = memory_items or settings['memory_items']
+        self.revalidate_after = revalidate_after or settings['revalidate_after']
+        self.request_timeout = settings['request_timeout']
+        self.logger = logging.getLogger('brainrot_image_store')
+
+        self._session = session
+        self._owns_session = session is None
+        self._memory = OrderedDict()  # (url, size) -> (fitted image, fetched_at)
+        self._inflight = {}  # (url, size) -> task loading that image
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get(self, url, size):
+        """Return the image at `url` fitted to `size`, or None if it can't be loaded.
+
+        The returned image is shared with the cache and must not be modified.
+        Concurrent calls for the same image share a single fetch and decode.
+        """
+        key = (url, tuple(size))
+        entry = self._memory.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.revalidate_after:
+            self._memory.move_to_end(key)
+            return entry[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, entry))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, key, entry):
+        url, size = key
+        image_data = await self._fetch(url)
+        if image_data is None:
+            # Keep serving a stale copy rather than nothing if revalidation failed.
+            return entry[0] if entry is not None else None
+
+        try:
+            image = await asyncio.to_thread(self._decode_and_fit, image_data, size)
+        except Exception as e:
+            self.logger.error(f"Failed to process image data from {url}: {str(e)}")
+            return None
+
+        self._memory[key] = (image, time.monotonic())
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+        return image
+
+    async def _fetch(self, url):
+        body_path, meta_path = self._paths(url)
+        meta = await asyncio.to_thread(self._read_meta, meta_path)
+        has_copy = meta is not None and body_path.exists()
+
+        headers = {}
+        if has_copy:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            async with self.session.get(url, headers=headers, timeout=timeout) as resp:
+                self.logger.info(f"Image request status: {resp.status}")
+                if resp.status == 304 and has_copy:
+                    return await asyncio.to_thread(body_path.read_bytes)
+                if resp.status == 200:
+                    image_data = await resp.read()
+                    meta = {
+                        'url': url,
+                        'etag': resp.headers.get('ETag'),
+                        'last_modified': resp.headers.get('Last-Modified'),
+                    }
+                    await asyncio.to_thread(self._write, body_path, meta_path, image_data, meta)
+                    return image_data
+                self.logger.warning(f"Failed to fetch image (status {resp.status}): {url}")
+        except Exception as e:
+            self.logger.error(f"Network error loading image {url}: {str(e)}")
+
+        if has_copy:
+            self.logger.info(f"Serving cached copy of {url}")
+            return await asyncio.to_thread(body_path.read_bytes)
+        return None
+
+    def _paths(self, url):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{digest}.bin', self.directory / f'{digest}.json'
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading image metadata {meta_path}: {e}")
+            return None
+
+    def _write(self, body_path, meta_path, image_data, meta):
+        try:
+            temp_path = body_path.with_suffix('.tmp')
+            temp_path.write_bytes(image_data)
+            temp_path.replace(body_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except Exception as e:
+            self.logger.error(f"Error caching image {meta.get('url')}: {e}")
+
+    @staticmethod
+    def _decode_and_fit(image_data, size):
+        with BytesIO(image_data) as bio:
+            image = Image.open(bio).convert('RGBA')
+        return ImageOps.fit(image, size, Image.Resampling.LANCZOS)
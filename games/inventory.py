@@ -1,10 +1,81 @@
 import discord
 from discord.ext import commands
-import json
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
-from pathlib import Path
+from . import collection_store
+from .catalog import catalog
+
+RARITY_TEXT = {
+    'legendary': '[L]',
+    'normal': '[N]',
+    'loser': '[X]'
+}
+
+
+class InventorySnapshot:
+    """One user's collection, bucketed by card type, with page embeds cached.
+
+    Built once from a collection and the catalog; paging through it never
+    touches the database. `key` is the (collection version, catalog version)
+    it was built from, so the view can tell when to rebuild it.
+    """
+
+    def __init__(self, user_id: str, collection: Dict, characters: Dict, key, items_per_page: int = 5):
+        self.user_id = user_id
+        self.key = key
+        self.items_per_page = items_per_page
+        self.buckets = {"All": []}
+        for card_id, count in collection.items():
+            char_info = characters.get(card_id)
+            if char_info:
+                item = {**char_info, "count": count}
+                self.buckets["All"].append(item)
+                self.buckets.setdefault(char_info["type"], []).append(item)
+        self._embeds = {}  # (character type, page) -> discord.Embed
+
+    def items(self, character_type: str) -> List[Dict]:
+        return self.buckets.get(character_type, [])
+
+    def page_count(self, character_type: str) -> int:
+        return max(1, (len(self.items(character_type)) - 1) // self.items_per_page + 1)
+
+    def embed(self, character_type: str, page: int) -> discord.Embed:
+        """The embed for one page, rendered on first use and then reused."""
+        key = (character_type, page)
+        embed = self._embeds.get(key)
+        if embed is None:
+            embed = self._render(character_type, page)
+            self._embeds[key] = embed
+        return embed
+
+    def _render(self, character_type: str, page: int) -> discord.Embed:
+        inventory = self.items(character_type)
+        start_idx = page * self.items_per_page
+        current_items = inventory[start_idx:start_idx + self.items_per_page]
+
+        embed = discord.Embed(
+            title="Character Collection",
+            description=f"Filter: {character_type}"
+        )
+
+        if not current_items:
+            embed.description = "No characters found!"
+            return embed
+
+        for item in current_items:
+            rarity_text = RARITY_TEXT.get(item['type'], '[N]')
+            embed.add_field(
+                name=f"{rarity_text} {item['name']} #{item['id']}",
+                value=f"Type: {item['type'].capitalize()}\nOwned: x{item['count']}",
+                inline=False
+            )
+
+        embed.set_footer(
+            text=f"Page {page + 1}/{self.page_count(character_type)} • Total Cards: {len(inventory)}"
+        )
+        return embed
+
 
 class InventoryView(discord.ui.View):
     def __init__(self, cog, user_id: str, character_type: str = "All"):
@@ -15,8 +86,21 @@ class InventoryView(discord.ui.View):
         self.current_page = 0
         self.items_per_page = 5
         self.character_type = character_type
+        self.snapshot = None
+
+    async def refresh(self):
+        """Rebuild the snapshot if the user's cards or the catalog changed, then update the buttons."""
+        key = (self.cog.collections.version(self.user_id), catalog.version)
+        if self.snapshot is None or self.snapshot.key != key:
+            collection = await self.cog.get_user_inventory(self.user_id)
+            characters = await self.cog.get_character_data(collection)
+            self.snapshot = InventorySnapshot(self.user_id, collection, characters, key, self.items_per_page)
+        self.current_page = min(self.current_page, self.snapshot.page_count(self.character_type) - 1)
         self.update_buttons()
 
+    def current_embed(self) -> discord.Embed:
+        return self.snapshot.embed(self.character_type, self.current_page)
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.invoker_id:
             await interaction.response.send_message("This menu is not for you!", ephemeral=True)
@@ -58,122 +142,30 @@ class InventoryView(discord.ui.View):
         await self.update_inventory_message(interaction)
 
     def update_buttons(self):
-        total_items = len(self.get_filtered_inventory())
-        total_pages = (total_items - 1) // self.items_per_page + 1
+        total_pages = self.snapshot.page_count(self.character_type)
 
         self.prev_button.disabled = self.current_page <= 0
         self.next_button.disabled = self.current_page >= total_pages - 1
 
-    def get_filtered_inventory(self) -> List[Dict]:
-        inventory = []
-        user_data = self.cog.get_user_inventory(self.user_id)
-        char_data = self.cog.get_character_data()
-
-        if not user_data or not char_data:
-            return []
-
-        for card_id, count in user_data.items():
-            char_info = next((c for c in char_data["characters"] if c["id"] == card_id), None)
-            if char_info:
-                if self.character_type == "All" or char_info["type"] == self.character_type:
-                    inventory.append({**char_info, "count": count})
-
-        return inventory
-
     async def update_inventory_message(self, interaction: discord.Interaction):
-        self.update_buttons()
-        embed = self.cog.create_inventory_embed(
-            self.user_id,
-            self.current_page,
-            self.items_per_page,
-            self.get_filtered_inventory(),
-            self.character_type
-        )
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.refresh()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
 
 class Inventory(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('inventory')
-        self.data_dir = Path('data').absolute()
-        self.users_file = self.data_dir / 'users.json'
-        self.characters_file = self.data_dir / 'characters.json'
-        
-        # Ensure data directory exists
-        self.data_dir.mkdir(exist_ok=True)
-
-    def load_data(self) -> tuple:
-        """Load both user and character data"""
-        try:
-            if not self.users_file.exists():
-                users_data = {"users": {}}
-            else:
-                with open(self.users_file, 'r', encoding='utf-8') as f:
-                    users_data = json.load(f)
-                    # Validate and fix user data structure
-                    if not isinstance(users_data, dict) or "users" not in users_data:
-                        users_data = {"users": {}}
-                    # Ensure each user has proper structure
-                    for user_id in users_data["users"]:
-                        if "claimed_characters" not in users_data["users"][user_id]:
-                            users_data["users"][user_id]["claimed_characters"] = {}
-                
-            with open(self.characters_file, 'r', encoding='utf-8') as f:
-                chars_data = json.load(f)
-                
-            return users_data, chars_data
-        except Exception as e:
-            self.logger.error(f"Error loading data: {e}")
-            return {"users": {}}, {"characters": []}
-
-    def get_user_inventory(self, user_id: str) -> Dict:
-        """Get user's inventory with fresh data"""
-        try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users_data = json.load(f)
-                user_data = users_data.get("users", {}).get(str(user_id), {})
-                return user_data.get("claimed_characters", {})
-        except Exception as e:
-            self.logger.error(f"Error loading user inventory: {e}")
-            return {}
-
-    def get_character_data(self) -> Dict:
-        _, chars_data = self.load_data()
-        return chars_data
-
-    def create_inventory_embed(self, user_id: str, page: int, items_per_page: int, 
-                             inventory: List[Dict], filter_type: str) -> discord.Embed:
-        start_idx = page * items_per_page
-        end_idx = start_idx + items_per_page
-        current_items = inventory[start_idx:end_idx]
-        
-        embed = discord.Embed(
-            title="Character Collection",
-            description=f"Filter: {filter_type}"
-        )
-        
-        if not current_items:
-            embed.description = "No characters found!"
-            return embed
 
-        for item in current_items:
-            rarity_text = {
-                'legendary': '[L]',
-                'normal': '[N]',
-                'loser': '[X]'
-            }.get(item['type'], '[N]')
-            
-            embed.add_field(
-                name=f"{rarity_text} {item['name']} #{item['id']}",
-                value=f"Type: {item['type'].capitalize()}\nOwned: x{item['count']}",
-                inline=False
-            )
+    async def cog_load(self):
+        self.collections = await collection_store.attach(self.bot)
 
-        total_pages = (len(inventory) - 1) // items_per_page + 1
-        embed.set_footer(
-            text=f"Page {page + 1}/{total_pages} • Total Cards: {len(inventory)}"
-        )
-        return embed
+    async def get_user_inventory(self, user_id: str) -> Dict:
+        """Get user's inventory from the shared collection store"""
+        return await self.collections.get_collection(user_id)
+
+    async def get_character_data(self, card_ids) -> Dict:
+        """Characters for the given card ids, keyed by id"""
+        return catalog.get_many(card_ids)
 
     @commands.command(name="inventory", aliases=["inv"])
     async def show_inventory(self, ctx, member: Optional[discord.Member] = None):
@@ -181,14 +173,8 @@ class Inventory(commands.Cog):
         target = member if member else ctx.author
         view = InventoryView(self, str(target.id))
         view.invoker_id = ctx.author.id  # Set the invoker's ID
-        embed = self.create_inventory_embed(
-            str(target.id),
-            0,
-            view.items_per_page,
-            view.get_filtered_inventory(),
-            "All"
-        )
-        message = await ctx.send(embed=embed, view=view)
+        await view.refresh()
+        message = await ctx.send(embed=view.current_embed(), view=view)
         view.message = message  # Store message reference for timeout handling
 
     async def handle_inventory_error(self, ctx):
@@ -0,0 +1,156 @@
+"""Append-only journal of card sales.
+
+Sales are recorded in month partitions: one collection per month, named
+`transactions_YYYY_MM` after each entry's timestamp. Old months are never
+touched again, and a report over a date range only reads the partitions it
+needs.
+
+`record` only appends to an in-memory buffer, so a sale never waits on the
+database. A background task group-commits the buffer with one insert_many
+per partition. It runs every `flush_interval` seconds, or sooner once
+`batch_size` entries are waiting. If the bot crashes, the last
+`flush_interval` seconds of entries can be lost; a clean shutdown flushes.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import datetime
+
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError
+
+from db.mongo import db
+
+PARTITION_PATTERN = re.compile(r'^(?P<prefix>.+)_(?P<year>\d{4})_(?P<month>\d{2})$')
+
+
+class TransactionJournal:
+    def __init__(self, database=db, prefix='transactions', batch_size=100, flush_interval=1.0):
+        self.database = database
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger('brainrot_journal')
+        self._buffer = []
+        self._wake = asyncio.Event()
+        self._task = None
+        self._flush_lock = asyncio.Lock()
+        self._indexed = set()
+
+    def partition_name(self, timestamp):
+        """Partition for an ISO timestamp string or datetime, e.g. transactions_2024_11."""
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        return f"{self.prefix}_{timestamp[:4]}_{timestamp[5:7]}"
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def record(self, entry):
+        """Queue an entry; O(1) and never blocks on the database."""
+        entry = dict(entry)
+        entry.setdefault('timestamp', datetime.now().isoformat())
+        self._buffer.append(entry)
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def ensure_partition(self, name):
+        """Create the indexes for a partition (once per process)."""
+        if name in self._indexed:
+            return
+        await self.database[name].create_index([('user_id', ASCENDING), ('timestamp', ASCENDING)])
+        await self.database[name].create_index([('timestamp', ASCENDING)])
+        self._indexed.add(name)
+
+    async def flush(self):
+        """Write everything buffered so far; returns how many entries were written."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+            pending, self._buffer = self._buffer, []
+            partitions = {}
+            for entry in pending:
+                partitions.setdefault(self.partition_name(entry['timestamp']), []).append(entry)
+
+            written = 0
+            failed = []
+            for name, entries in partitions.items():
+                try:
+                    await self.ensure_partition(name)
+                    await self.database[name].insert_many(entries, ordered=False)
+                    written += len(entries)
+                except BulkWriteError as e:
+                    # insert_many gave every entry an _id, so a retry can't duplicate
+                    # anything: entries that already landed fail with a duplicate key.
+                    retry = {err['index'] for err in e.details.get('writeErrors', []) if err.get('code') != 11000}
+                    written += len(entries) - len(retry)
+                    failed.extend(entry for i, entry in enumerate(entries) if i in retry)
+                    errors = e.details.get('writeErrors') or [{}]
+                    self.logger.error(f"{len(retry)} of {len(entries)} transactions failed to write to {name}, "
+                                      f"first error: {errors[0].get('errmsg')}")
+                except Exception as e:
+                    failed.extend(entries)
+                    self.logger.error(f"Error writing {len(entries)} transactions to {name}: {e}")
+            if failed:
+                # Retry with the next flush, ahead of anything recorded meanwhile.
+                self._buffer[:0] = failed
+            return written
+
+    async def partitions(self, since=None, until=None):
+        """Partition names in chronological order, limited to [since, until] if given."""
+        names = []
+        for name in await self.database.list_collection_names():
+            match = PARTITION_PATTERN.match(name)
+            if match and match['prefix'] == self.prefix:
+                names.append(name)
+        names.sort()
+        if since is not None:
+            names = [n for n in names if n >= self.partition_name(since)]
+        if until is not None:
+            names = [n for n in names if n <= self.partition_name(until)]
+        return names
+
+    async def read(self, user_id=None, since=None, until=None):
+        """Stream entries oldest first, one partition at a time.
+
+        `since` and `until` are ISO timestamp strings or datetimes.
+        """
+        query = {}
+        if user_id is not None:
+            query['user_id'] = str(user_id)
+        bounds = {}
+        if since is not None:
+            bounds['$gte'] = since.isoformat() if isinstance(since, datetime) else since
+        if until is not None:
+            bounds['$lte'] = until.isoformat() if isinstance(until, datetime) else until
+        if bounds:
+            query['timestamp'] = bounds
+
+        for name in await self.partitions(since, until):
+            cursor = self.database[name].find(query, {'_id': 0}).sort('timestamp', ASCENDING)
+            async for entry in cursor:
+                yield entry
+
+
+journal = TransactionJournal()
@@ -0,0 +1,275 @@
+"""Card rendering for the drop game.
+
+Everything in this module is plain, synchronous Pillow code with no reference
+to the bot, so it can run inside the render service's worker processes. Jobs
+are plain dicts (see card_job / drop_job) and every job returns PNG bytes.
+"""
+
+import logging
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageOps
+
+from . import config, gradients, templates, text_layout
+
+logger = logging.getLogger('brainrot_render')
+
+# Bump whenever a change here alters how cards look, so cached renders are discarded.
+TEMPLATE_VERSION = 1
+
+TITLE_FONT_TYPE = 'bold'
+SUBTITLE_FONT_TYPE = 'regular'
+DESCRIPTION_FONT_TYPE = 'light'
+TITLE_FONT_SIZE = 40
+DESCRIPTION_FONT_SIZE = 24
+
+
+CARD_PADDING = 30
+
+
+def character_image_size(card_width=800, card_height=400):
+    """Size of the character art area on a card of the given dimensions."""
+    return (card_width // 2 - 2 * CARD_PADDING, card_height - 2 * CARD_PADDING)
+
+
+def card_job(character, char_image, card_width=800, card_height=400):
+    """Build a picklable job spec for a single character card.
+
+    `char_image` is the character art (ideally already fitted to
+    character_image_size) or None to draw the "No Image" placeholder.
+    """
+    return {
+        'kind': 'card',
+        'character': dict(character),
+        'card_type': character['type'],
+        'char_image': char_image,
+        'width': card_width,
+        'height': card_height,
+    }
+
+
+def drop_job(count, card_width=350, card_height=600, spacing=20):
+    """Build a picklable job spec for the face-down drop image."""
+    return {
+        'kind': 'drop',
+        'count': count,
+        'width': card_width,
+        'height': card_height,
+        'spacing': spacing,
+    }
+
+
+def run_job(job):
+    """Worker entry point: render a job spec and return encoded PNG bytes."""
+    if job['kind'] == 'card':
+        image = render_card(job['character'], job['char_image'], job['width'], job['height'])
+    elif job['kind'] == 'drop':
+        image = render_drop(job['count'], job['width'], job['height'], job['spacing'])
+    else:
+        raise ValueError(f"Unknown render job kind: {job['kind']}")
+    return encode_png(image)
+
+
+def encode_png(image):
+    with BytesIO() as buffer:
+        image.save(buffer, 'PNG')
+        return buffer.getvalue()
+
+
+def render_card(character, char_image, card_width=800, card_height=400):
+    """Compose a full character card."""
+    if char_image is None:
+        char_image = create_empty_image()
+
+    # The background is fully opaque, so it doubles as the blank card.
+    card = gradients.subtle_background(card_width, card_height).copy()
+
+    padding = CARD_PADDING
+    image_area = (padding, padding, card_width // 2 - padding, card_height - padding)
+
+    char_width = image_area[2] - image_area[0]
+    char_height = image_area[3] - image_area[1]
+
+    char_image = char_image.convert('RGBA')
+    char_image = ImageOps.fit(char_image, (char_width, char_height), Image.Resampling.LANCZOS)
+
+    char_mask = Image.new('L', char_image.size, 255)
+
+    card.paste(char_image, (image_area[0], image_area[1]), char_mask)
+
+    draw = ImageDraw.Draw(card)
+    text_area = (card_width // 2 + padding, padding, card_width - padding, card_height - padding)
+    draw_modern_text(draw, text_area, character)
+
+    card = apply_rounded_corners(card, templates.CARD_CORNER_RADIUS)
+
+    return apply_gradient_border(card, templates.CARD_BORDER_WIDTH, character['type'])
+
+
+def render_drop(count, card_width=350, card_height=600, spacing=20):
+    """Lay out `count` face-down cards side by side."""
+    return templates.drop_image(count, card_width, card_height, spacing)
+
+
+def apply_rounded_corners(image, radius):
+    """Apply rounded corners to an image."""
+    return templates.rounded_corners(image, radius)
+
+
+def draw_modern_text(draw, text_area, character):
+    """Enhanced text drawing with better styling."""
+    x1, y1, x2, y2 = text_area
+    max_width = x2 - x1
+
+    base_colors = {
+        'title': (255, 255, 255, 255),
+        'description': (220, 220, 220, 255),
+    }
+
+    type_colors = {
+        'normal': {
+            'bg': (114, 137, 218, 255),
+            'text': (255, 255, 255, 255),
+            'id': (180, 180, 180, 255)
+        },
+        'legendary': {
+            'bg': (255, 215, 0, 255),
+            'text': (0, 0, 0, 255),
+            'id': (255, 215, 0, 255)
+        },
+        'loser': {
+            'bg': (220, 20, 60, 255),
+            'text': (255, 255, 255, 255),
+            'id': (220, 20, 60, 255)
+        }
+    }
+
+    color_scheme = type_colors.get(character['type'], type_colors['normal'])
+
+    title_text = character['name']
+    id_text = f"#{character['id']}"
+    type_text = character['type'].capitalize()
+    description = character.get('description', '')
+
+    title_size = text_layout.fit_font_size(TITLE_FONT_TYPE, 48, title_text, max_width * 0.9)
+    desc_size = text_layout.fit_wrapped_font_size(
+        DESCRIPTION_FONT_TYPE, DESCRIPTION_FONT_SIZE, description, max_width, y2 - y1)
+
+    title_font = config.load_font(TITLE_FONT_TYPE, title_size)
+    type_font = config.load_font(SUBTITLE_FONT_TYPE, 28)
+    desc_font = config.load_font(DESCRIPTION_FONT_TYPE, desc_size)
+    id_font = config.load_font(SUBTITLE_FONT_TYPE, 24)
+
+    title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
+    title_height = title_bbox[3] - title_bbox[1]
+
+    type_bbox = draw.textbbox((0, 0), type_text, font=type_font)
+    type_height = type_bbox[3] - type_bbox[1]
+
+    wrapped_text = text_layout.wrap_text(description, DESCRIPTION_FONT_TYPE, desc_size, max_width)
+    desc_bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=desc_font)
+    desc_height = desc_bbox[3] - desc_bbox[1]
+
+    total_height = title_height + type_height + desc_height + 60
+    start_y = y1 + (y2 - y1 - total_height) // 2
+
+    current_y = start_y
+    shadow_offset = 2
+    draw.text((x1+shadow_offset, current_y+shadow_offset), title_text,
+              font=title_font, fill=(0, 0, 0, 80))
+    draw.text((x1, current_y), title_text,
+              font=title_font, fill=base_colors['title'])
+
+    current_y += title_height + 25
+    badge_padding = 12
+    type_bbox = draw.textbbox((0, 0), type_text, font=type_font)
+    badge_width = type_bbox[2] - type_bbox[0] + badge_padding * 3
+    badge_height = type_bbox[3] - type_bbox[1] + badge_padding * 2
+
+    badge_bg = Image.new('RGBA', (int(badge_width), int(badge_height)), color_scheme['bg'])
+
+    badge_mask = Image.new('L', (int(badge_width), int(badge_height)), 0)
+    badge_draw = ImageDraw.Draw(badge_mask)
+    badge_draw.rounded_rectangle([(0, 0), (badge_width-1, badge_height-1)],
+                               radius=badge_height//3, fill=255)
+
+    badge_x = x1
+    badge_y = current_y
+
+    badge_bg.putalpha(badge_mask)
+    draw._image.paste(badge_bg, (int(badge_x), int(badge_y)), badge_bg)
+
+    type_x = badge_x + badge_padding
+    type_y = badge_y + (badge_height - type_bbox[3] + type_bbox[1]) // 2
+    draw.text((type_x, type_y), type_text,
+              font=type_font, fill=color_scheme['text'])
+
+    current_y += badge_height + 25
+    draw.multiline_text((x1, current_y), wrapped_text,
+                       font=desc_font, fill=base_colors['description'],
+                       spacing=6)
+
+    id_bbox = draw.textbbox((0, 0), id_text, font=id_font)
+    id_width = id_bbox[2] - id_bbox[0]
+    id_height = id_bbox[3] - id_bbox[1]
+    id_x = x2 - id_width - 10
+    id_y = y2 - id_height - 10
+
+    draw.text((id_x+1, id_y+1), id_text,
+              font=id_font, fill=(0, 0, 0, 80))
+    draw.text((id_x, id_y), id_text,
+              font=id_font, fill=color_scheme['id'])
+
+
+def apply_gradient_border(image, border_width, character_type):
+    """Apply an enhanced gradient border with inner glow."""
+    try:
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+
+        image = Image.alpha_composite(image, templates.inner_glow(image.size, character_type))
+
+        final = templates.border_layer(image.size, border_width, character_type).copy()
+        final.paste(image, (border_width, border_width), image)
+
+        return final
+
+    except Exception as e:
+        logger.error(f"Error applying gradient border: {e}")
+        return image
+
+
+def create_empty_image(size=(400, 300)):
+    """Create a simple empty image with text."""
+    title_font = config.load_font(TITLE_FONT_TYPE, TITLE_FONT_SIZE)
+    img = Image.new('RGBA', size, (40, 40, 40, 255))
+    draw = ImageDraw.Draw(img)
+
+    border = 10
+    draw.rectangle(
+        [border, border, size[0]-border, size[1]-border],
+        outline=(100, 100, 100, 255),
+        width=2
+    )
+
+    text = "No Image Available"
+    bbox = draw.textbbox((0, 0), text, font=title_font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (size[0] - text_width) // 2
+    y = (size[1] - text_height) // 2
+
+    draw.text(
+        (x+2, y+2),
+        text,
+        font=title_font,
+        fill=(0, 0, 0, 128)
+    )
+    draw.text(
+        (x, y),
+        text,
+        font=title_font,
+        fill=(200, 200, 200, 255)
+    )
+
+    return img
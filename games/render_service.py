@@ -0,0 +1,119 @@
+"""Off-loop rendering service for the drop game.
+
+Card rendering is pure CPU work, so it runs in a bounded process pool instead
+of on the event loop. Jobs are picklable dicts built by games.render and every
+job resolves to encoded PNG bytes.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import config, render, templates
+
+
+class RenderError(Exception):
+    """Base error for render jobs that could not be completed."""
+
+
+class RenderQueueFull(RenderError):
+    """Raised when too many jobs are already waiting for a worker."""
+
+
+class RenderTimeout(RenderError):
+    """Raised when a job does not finish within the per-job timeout."""
+
+
+class RenderService:
+    def __init__(self, workers=None, max_queue=None, job_timeout=None, queue_wait=None):
+        settings = config.GAME_SETTINGS['render']
+        self.workers = workers or settings['workers']
+        self.max_queue = max_queue or settings['max_queue']
+        self.job_timeout = job_timeout or settings['job_timeout']
+        self.queue_wait = queue_wait if queue_wait is not None else settings['queue_wait']
+        self.logger = logging.getLogger('brainrot_render')
+
+        self._pool = None
+        self._slots = None
+        self._pending = 0
+
+    def start(self):
+        """Create the worker pool. Worker processes are spawned on first use."""
+        if self._pool is not None:
+            return
+        # Never fork the bot process itself: it holds sockets and threads that
+        # must not be duplicated into the workers. The fork server imports
+        # bot.py's top level (including `bot = MyBot()` and the Mongo client)
+        # once, without connecting, and workers fork from it instead of each
+        # re-importing bot.py as spawn would. Windows only has spawn.
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['__main__', 'games.render'])
+        else:
+            context = multiprocessing.get_context('spawn')
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=templates.warm
+        )
+        self._slots = asyncio.Semaphore(self.max_queue)
+        self._pending = 0
+        self.logger.info(f"Render service started with {self.workers} workers (queue limit {self.max_queue})")
+
+    def shutdown(self):
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._slots = None
+        self._pending = 0
+        self.logger.info("Render service stopped")
+
+    @property
+    def pending(self):
+        """Number of jobs currently queued or running."""
+        return self._pending
+
+    async def submit(self, job):
+        """Render a job spec in the pool and return the PNG bytes.
+
+        Waits up to `queue_wait` seconds for a queue slot before raising
+        RenderQueueFull, and raises RenderTimeout if the job itself runs longer
+        than `job_timeout`.
+        """
+        if self._pool is None:
+            self.start()
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_wait)
+        except asyncio.TimeoutError:
+            raise RenderQueueFull(f"Render queue is full ({self.max_queue} jobs pending)")
+
+        slots = self._slots
+        self._pending += 1
+
+        def release(_=None):
+            slots.release()
+            if self._slots is slots:  # not a job from a pool that was since restarted
+                self._pending -= 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._pool, render.run_job, job)
+        except Exception:
+            release()
+            raise
+        # The slot is only freed once the worker is actually done, so timed out
+        # jobs still count against the queue limit (and pending) until they finish.
+        future.add_done_callback(release)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=self.job_timeout)
+        except asyncio.TimeoutError:
+            raise RenderTimeout(f"Render job '{job['kind']}' timed out after {self.job_timeout}s")
+        except BrokenProcessPool as e:
+            self.logger.error(f"Render pool broke, restarting it: {e}")
+            self.shutdown()
+            raise RenderError("Render worker crashed") from e
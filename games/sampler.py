@@ -0,0 +1,145 @@
+"""Weighted drop sampling with Walker alias tables.
+
+A drop picks a rarity with the configured probabilities, then a character of
+that rarity. Characters default to weight 1, and an optional `weight` field
+in data/characters.json changes that. Both draws use alias tables (Vose's
+construction), so each draw is O(1) no matter how many characters exist.
+
+Character tables are rebuilt only when the catalog version changes. Rarity
+tables are cached per probability set. Guilds can override the default
+probabilities; see set_guild_probabilities and
+GAME_SETTINGS['guild_probabilities'].
+"""
+
+import logging
+import random
+
+from . import config
+from .catalog import catalog
+
+logger = logging.getLogger('brainrot_sampler')
+
+
+class AliasTable:
+    """O(1) sampling from a fixed discrete distribution (Vose's alias method)."""
+
+    def __init__(self, items, weights):
+        if len(items) != len(weights):
+            raise ValueError("items and weights must have the same length")
+        total = float(sum(weights))
+        if not items or total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("weights must be non-negative with a positive sum")
+
+        n = len(items)
+        self.items = list(items)
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left is 1 up to rounding error.
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+class DropSampler:
+    def __init__(self, catalog, probabilities=None, guild_probabilities=None, rng=None):
+        self.catalog = catalog
+        self.default_probabilities = dict(probabilities or config.GAME_SETTINGS['probabilities'])
+        self.guild_probabilities = {str(k): dict(v) for k, v in (guild_probabilities or {}).items()}
+        self.rng = rng or random.Random()
+        self._catalog_version = None
+        self._characters = {}  # type -> AliasTable of characters
+        self._rarities = {}  # frozen probabilities -> AliasTable of types
+
+    def set_guild_probabilities(self, guild_id, probabilities):
+        """Override some or all type probabilities for a guild; None removes the override."""
+        if probabilities is None:
+            self.guild_probabilities.pop(str(guild_id), None)
+        else:
+            self.guild_probabilities[str(guild_id)] = dict(probabilities)
+
+    def probabilities_for(self, guild_id=None):
+        probabilities = dict(self.default_probabilities)
+        if guild_id is not None:
+            probabilities.update(self.guild_probabilities.get(str(guild_id), {}))
+        return probabilities
+
+    def _refresh(self):
+        types = self.catalog.types()  # also picks up an edited catalog file
+        if self._catalog_version == self.catalog.version:
+            return
+        self._characters = {}
+        for card_type in types:
+            characters = self.catalog.of_type(card_type)
+            weights = [c.get('weight', 1) for c in characters]
+            try:
+                self._characters[card_type] = AliasTable(characters, weights)
+            except ValueError as e:
+                logger.warning(f"No drawable characters of type '{card_type}': {e}")
+        self._rarities = {}
+        self._catalog_version = self.catalog.version
+        logger.info(f"Built alias tables for catalog version {self._catalog_version}")
+
+    def _rarity_table(self, probabilities):
+        # Types with no characters can't be drawn, so their share goes to the rest.
+        key = frozenset((t, p) for t, p in probabilities.items() if t in self._characters and p > 0)
+        table = self._rarities.get(key)
+        if table is None and key:
+            types, weights = zip(*sorted(key))
+            table = self._rarities[key] = AliasTable(types, weights)
+        return table
+
+    def sample_rarity(self, guild_id=None):
+        self._refresh()
+        table = self._rarity_table(self.probabilities_for(guild_id))
+        return table.sample(self.rng) if table else None
+
+    def sample(self, k, guild_id=None):
+        """k distinct characters; slots that can't be filled are None.
+
+        Each slot draws its rarity independently; a character that is
+        already in the drop is redrawn from the same rarity, so duplicates
+        never change the rarity distribution.
+        """
+        self._refresh()
+        rarities = self._rarity_table(self.probabilities_for(guild_id))
+        chosen, ids = [], set()
+        for _ in range(k):
+            if rarities is None:
+                chosen.append(None)
+                continue
+            card_type = rarities.sample(self.rng)
+            table = self._characters[card_type]
+            character = None
+            for _ in range(16):
+                candidate = table.sample(self.rng)
+                if candidate['id'] not in ids:
+                    character = candidate
+                    break
+            if character is None:
+                remaining = [c for c in table.items if c['id'] not in ids]
+                character = self.rng.choice(remaining) if remaining else None
+            if character is None:
+                logger.warning(f"No characters of type '{card_type}' left for this drop.")
+            else:
+                ids.add(character['id'])
+            chosen.append(character)
+        return chosen
+
+
+sampler = DropSampler(catalog, guild_probabilities=config.GAME_SETTINGS.get('guild_probabilities'))
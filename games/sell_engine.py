@@ -0,0 +1,172 @@
+"""Pricing and settlement for card sales.
+
+Every sale goes through a quote:
+1. `quote` prices any set of {card_id: count} in one vectorized pass. Each
+   stack gets one random price per card within its type's range, times the
+   count, as before. Loser cards are kept.
+2. The quote is stored under a short token for `quote_ttl` seconds. Asking
+   again for the same cards returns the same quote, so the price shown in a
+   preview or a confirmation is the price paid. A quote shown in a preview is
+   held: cancelling a confirmation that reused it leaves it redeemable until
+   it expires.
+3. `execute` settles a quote: a conditional debit of every card, the aura
+   credit, and one aggregated journal entry. The card debit is all or
+   nothing; if the credit fails, the cards are given back.
+"""
+
+import logging
+import secrets
+import time
+
+import numpy as np
+
+from db.ledger import ledger as default_ledger
+from .catalog import catalog
+from .journal import journal as default_journal
+
+DEFAULT_POINT_RANGES = {
+    'normal': (100, 500),
+    'legendary': (2000, 5000),
+    'loser': (500, 1000)
+}
+UNSELLABLE_TYPES = {'loser'}
+
+
+class SellError(Exception):
+    """A quote could not be settled; the message is safe to show the user."""
+
+
+class SellEngine:
+    def __init__(self, collections, point_ranges=None, quote_ttl=60, rng=None, ledger=None, journal=None):
+        self.collections = collections
+        self.ledger = ledger if ledger is not None else default_ledger
+        self.journal = journal if journal is not None else default_journal
+        self.point_ranges = dict(point_ranges or DEFAULT_POINT_RANGES)
+        self.quote_ttl = quote_ttl
+        self.rng = rng or np.random.default_rng()
+        self.logger = logging.getLogger('brainrot_sell')
+        self._quotes = {}  # token -> quote
+        self._by_cards = {}  # (user_id, frozenset of card counts) -> token
+
+    def _expire(self):
+        now = time.monotonic()
+        for token in [t for t, q in self._quotes.items() if q['expires_at'] <= now]:
+            self._drop(token)
+
+    def _drop(self, token):
+        quote = self._quotes.pop(token, None)
+        if quote is not None:
+            self._by_cards.pop((quote['user_id'], frozenset(quote['requested'].items())), None)
+        return quote
+
+    def value(self, cards):
+        """Price {card_id: count} in one pass; returns (lines, total).
+
+        Each line is a dict with card_id, name, type, count, points and
+        sold (False for kept loser cards). Unknown cards are left out.
+        """
+        characters = catalog.get_many(cards)
+        lines = []
+        for card_id, count in cards.items():
+            character = characters.get(str(card_id))
+            if character is None or count <= 0:
+                continue
+            lines.append({
+                'card_id': str(card_id),
+                'name': character['name'],
+                'type': character['type'],
+                'count': count,
+                'points': 0,
+                'sold': character['type'] not in UNSELLABLE_TYPES,
+            })
+
+        sold = [line for line in lines if line['sold']]
+        if sold:
+            ranges = [self.point_ranges.get(line['type'], (100, 500)) for line in sold]
+            low = np.array([r[0] for r in ranges])
+            high = np.array([r[1] for r in ranges])
+            counts = np.array([line['count'] for line in sold])
+            points = self.rng.integers(low, high, endpoint=True) * counts
+            for line, value in zip(sold, points.tolist()):
+                line['points'] = value
+        return lines, sum(line['points'] for line in sold)
+
+    def quote(self, user_id, cards):
+        """Price {card_id: count} for a user; returns the quote dict."""
+        self._expire()
+        user_id = str(user_id)
+        requested = {str(card_id): count for card_id, count in cards.items()}
+        token = self._by_cards.get((user_id, frozenset(requested.items())))
+        if token is not None:
+            return self._quotes[token]
+
+        lines, total = self.value(requested)
+        token = secrets.token_hex(4)
+        quote = {
+            'token': token,
+            'user_id': user_id,
+            'requested': requested,
+            'lines': lines,
+            'sold': {line['card_id']: line['count'] for line in lines if line['sold']},
+            'total': total,
+            'held': False,
+            'expires_at': time.monotonic() + self.quote_ttl,
+        }
+        self._quotes[token] = quote
+        self._by_cards[(user_id, frozenset(requested.items()))] = token
+        return quote
+
+    def get_quote(self, user_id, token):
+        """A live quote with this token belonging to the user, or None."""
+        self._expire()
+        quote = self._quotes.get(token)
+        if quote is None or quote['user_id'] != str(user_id):
+            return None
+        return quote
+
+    def seconds_left(self, quote):
+        return max(0, int(quote['expires_at'] - time.monotonic()))
+
+    def hold(self, quote):
+        """Mark a quote whose token was shown to the user; cancel leaves it alive."""
+        quote['held'] = True
+
+    def cancel(self, quote):
+        """Forget an unconfirmed quote, unless a preview handed out its token."""
+        if not quote['held']:
+            self._drop(quote['token'])
+
+    async def execute(self, quote, label=None):
+        """Settle a quote; returns the user's new balance or raises SellError.
+
+        Quotes are single use. `label` is the card_id recorded in the
+        journal ('all' for sell-all); it defaults to the single card sold,
+        or 'batch'.
+        """
+        if self._drop(quote['token']) is None or quote['expires_at'] <= time.monotonic():
+            raise SellError("This price quote has expired. Please request a new one.")
+        user_id, sold, total = quote['user_id'], quote['sold'], quote['total']
+        if not sold:
+            raise SellError("There are no sellable cards in this sale.")
+
+        if await self.collections.take_cards(user_id, sold) is None:
+            raise SellError("Card count has changed. Please try again.")
+        try:
+            new_balance = await self.ledger.add(user_id, total)
+        except Exception as e:
+            self.logger.error(f"Aura credit of {total} to {user_id} failed ({e}); returning cards {sold}")
+            await self.collections.give_cards(user_id, sold)
+            raise SellError("Error updating aura points.")
+
+        if label is None:
+            label = next(iter(sold)) if len(sold) == 1 else 'batch'
+        self.journal.record({
+            'user_id': user_id,
+            'card_id': label,
+            'cards': sold,
+            'points': total,
+            'count': sum(sold.values()),
+            'quote': quote['token'],
+        })
+        self.logger.info(f"User {user_id} sold {sum(sold.values())} cards ({label}) for {total} points")
+        return new_balance
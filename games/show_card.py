@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
-import json
-import os
+from .catalog import catalog
 
 class ShowCard(commands.Cog):
     def __init__(self, bot):
@@ -20,26 +19,18 @@ class ShowCard(commands.Cog):
                 return
 
         try:
-            with open('data/characters.json', 'r', encoding='utf-8') as f:
-                characters = json.load(f).get("characters", [])
-                character = next((c for c in characters if c['id'] == card_id), None)
+            character = catalog.get(card_id)
 
             if not character:
                 await ctx.send(f"No character found with ID #{card_id}")
                 return
 
-            card_path = await self.drop_cog.generate_card(character)
-            if not card_path or not os.path.exists(card_path):
+            card_image = await self.drop_cog.generate_card(character)
+            if not card_image:
                 await ctx.send("Error generating card image")
                 return
 
-            try:
-                await ctx.send(file=discord.File(card_path))
-            finally:
-                try:
-                    os.remove(card_path)
-                except Exception as e:
-                    print(f"Error cleaning up card file: {e}")
+            await ctx.send(file=discord.File(card_image, filename=f"card_{character['id']}.png"))
 
         except Exception as e:
             await ctx.send(f"Error showing card: {e}")
@@ -0,0 +1,136 @@
+"""Static card template layers for the drop game.
+
+The border, inner glow, rounded-corner masks and the face-down card
+depend only on size and card type, never on the character. Each layer is
+built once per process and memoized here, so rendering a card only has to
+composite the character art and text on top. The returned images are shared
+between calls; callers must copy them before drawing on them.
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from . import config, gradients
+
+CARD_TYPES = ('normal', 'legendary', 'loser')
+
+CARD_CORNER_RADIUS = 20
+CARD_BORDER_WIDTH = 5
+
+
+@lru_cache(maxsize=32)
+def rounded_mask(size, radius):
+    """'L' mask that keeps everything inside a rounded rectangle."""
+    mask = Image.new('L', size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+    return mask
+
+
+def rounded_corners(image, radius):
+    """Apply rounded corners to an image."""
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+
+    output = Image.new('RGBA', image.size, (0, 0, 0, 0))
+    output.paste(image, mask=rounded_mask(image.size, radius))
+
+    return output
+
+
+@lru_cache(maxsize=16)
+def inner_glow(size, character_type):
+    """Blurred rounded outline composited just inside the card border."""
+    colors = gradients.BORDER_GRADIENT_COLORS
+    gradient_top, _ = colors.get(character_type, colors['normal'])
+    width, height = size
+
+    glow = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(glow)
+    glow_color = gradient_top[:3] + (100,)
+    padding = 20
+    draw.rounded_rectangle(
+        [padding, padding, width-padding, height-padding],
+        radius=20,
+        outline=glow_color,
+        width=5
+    )
+    return glow.filter(ImageFilter.GaussianBlur(10))
+
+
+@lru_cache(maxsize=16)
+def border_layer(size, border_width, character_type):
+    """Gradient border ring for a card of `size`, sized to include the border."""
+    width, height = size
+    new_width = width + 2 * border_width
+    new_height = height + 2 * border_width
+
+    border_image = gradients.border_gradient(new_width, new_height, character_type).copy()
+
+    border_mask = Image.new('L', (new_width, new_height), 0)
+    mask_draw = ImageDraw.Draw(border_mask)
+    mask_draw.rounded_rectangle([0, 0, new_width-1, new_height-1], radius=25, fill=255)
+    mask_draw.rounded_rectangle([border_width, border_width,
+                               new_width-border_width-1, new_height-border_width-1],
+                              radius=20, fill=0)
+
+    border_image.putalpha(border_mask)
+
+    final = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
+    return Image.alpha_composite(final, border_image)
+
+
+@lru_cache(maxsize=8)
+def hidden_card(size):
+    """Create a hidden card that looks like a playing card back."""
+    card_width, card_height = size
+
+    card = Image.new('RGBA', size, (0, 0, 0, 255))
+    draw = ImageDraw.Draw(card)
+
+    border_width = 20
+    draw.rectangle(
+        [border_width, border_width, card_width - border_width, card_height - border_width],
+        outline=(255, 255, 255, 255),
+        width=3
+    )
+
+    draw.line(
+        [(border_width, border_width), (card_width - border_width, card_height - border_width)],
+        fill=(255, 255, 255, 255),
+        width=3
+    )
+    draw.line(
+        [(card_width - border_width, border_width), (border_width, card_height - border_width)],
+        fill=(255, 255, 255, 255),
+        width=3
+    )
+
+    return rounded_corners(card, radius=CARD_CORNER_RADIUS)
+
+
+@lru_cache(maxsize=8)
+def drop_image(count, card_width, card_height, spacing):
+    """`count` face-down cards side by side."""
+    total_width = (card_width * count) + (spacing * (count - 1))
+
+    base_image = Image.new('RGBA', (total_width, card_height), (0, 0, 0, 0))
+    card = hidden_card((card_width, card_height))
+
+    for index in range(count):
+        base_image.paste(card, (index * (card_width + spacing), 0), card)
+
+    return base_image
+
+
+def warm(card_size=(800, 400)):
+    """Build every per-type layer for the standard card and drop sizes up front."""
+    width, height = card_size
+    gradients.subtle_background(width, height)
+    rounded_mask(card_size, CARD_CORNER_RADIUS)
+    for character_type in CARD_TYPES:
+        inner_glow(card_size, character_type)
+        border_layer(card_size, CARD_BORDER_WIDTH, character_type)
+    drop_width, drop_height = config.GAME_SETTINGS['card_dimensions']['normal']
+    drop_image(3, drop_width, drop_height, 20)
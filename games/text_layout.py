@@ -0,0 +1,86 @@
+"""Text layout for the drop game cards.
+
+Font handles come from config.load_font, which caches one per (type, size).
+Font sizes are found by binary search rather than stepping down one point at
+a time, and every layout result is memoized by its text and box, so a known
+character's name and description are laid out once per process.
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+
+from . import config
+
+MIN_FONT_SIZE = 10
+
+# A single scratch surface for measuring text; measurements never draw on it.
+_measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
+@lru_cache(maxsize=4096)
+def text_width(text, font_type, size):
+    bbox = _measure.textbbox((0, 0), text, font=config.load_font(font_type, size))
+    return bbox[2] - bbox[0]
+
+
+def _largest_fitting_size(initial_size, fits):
+    """Largest size in (MIN_FONT_SIZE, initial_size] for which fits(size) holds.
+
+    Falls back to MIN_FONT_SIZE when nothing fits, like the old step-down loop.
+    Text extents grow with the font size, so the predicate is monotonic.
+    """
+    low, high = MIN_FONT_SIZE + 1, initial_size
+    best = MIN_FONT_SIZE
+    while low <= high:
+        mid = (low + high) // 2
+        if fits(mid):
+            best = mid
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+@lru_cache(maxsize=1024)
+def fit_font_size(font_type, initial_size, text, max_width):
+    """Largest font size at which `text` fits within max_width on one line."""
+    return _largest_fitting_size(initial_size, lambda size: text_width(text, font_type, size) <= max_width)
+
+
+@lru_cache(maxsize=1024)
+def wrap_text(text, font_type, size, max_width):
+    """Wrap text to fit within max_width using textbbox."""
+    words = text.split()
+    lines = []
+    current_line = ''
+
+    for word in words:
+        test_line = f"{current_line} {word}".strip()
+
+        if text_width(test_line, font_type, size) <= max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line)
+            current_line = word
+
+    if current_line:
+        lines.append(current_line)
+
+    return '\n'.join(lines)
+
+
+@lru_cache(maxsize=1024)
+def wrapped_height(text, font_type, size, max_width):
+    wrapped = wrap_text(text, font_type, size, max_width)
+    bbox = _measure.multiline_textbbox((0, 0), wrapped, font=config.load_font(font_type, size))
+    return bbox[3] - bbox[1]
+
+
+@lru_cache(maxsize=1024)
+def fit_wrapped_font_size(font_type, initial_size, text, max_width, max_height):
+    """Largest font size at which wrapped `text` fits within max_height."""
+    return _largest_fitting_size(
+        initial_size,
+        lambda size: wrapped_height(text, font_type, size, max_width) <= max_height
+    )
@@ -0,0 +1,98 @@
+import sys
+import os
+import time
+import logging
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PIL import Image, ImageDraw
+from games import gradients
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Per-pixel implementations the drop cog used before games/gradients.py,
+# kept here as the reference the vectorized layers must match exactly.
+
+def legacy_subtle_background(width, height):
+    base = Image.new('RGBA', (width, height), (45, 49, 66, 255))
+    gradient = Image.new('RGBA', (width, height), (28, 31, 42, 255))
+    mask = Image.new('L', (width, height))
+    for y in range(height):
+        value = int(255 * (1.5 * y / height))
+        value = min(255, max(0, value))
+        for x in range(width):
+            mask.putpixel((x, y), value)
+    return Image.composite(gradient, base, mask)
+
+def legacy_border_gradient(width, height, character_type):
+    gradient_top, gradient_bottom = gradients.BORDER_GRADIENT_COLORS[character_type]
+    border_image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(border_image)
+    for y in range(height):
+        ratio = y / height
+        r = int(gradient_top[0] * (1 - ratio) + gradient_bottom[0] * ratio)
+        g = int(gradient_top[1] * (1 - ratio) + gradient_bottom[1] * ratio)
+        b = int(gradient_top[2] * (1 - ratio) + gradient_bottom[2] * ratio)
+        draw.line([(0, y), (width, y)], fill=(r, g, b, 255))
+    return border_image
+
+def legacy_radial_gradient(size, center_color, edge_color):
+    width, height = size
+    center_x, center_y = width / 2, height / 2
+    max_distance = ((width/2)**2 + (height/2)**2)**0.5
+    gradient = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    pixels = gradient.load()
+    for y in range(height):
+        for x in range(width):
+            distance = ((x - center_x)**2 + (y - center_y)**2)**0.5
+            ratio = min(distance / max_distance, 1.0)
+            pixels[x, y] = tuple(
+                int(center_color[i] * (1 - ratio) + edge_color[i] * ratio) for i in range(4)
+            )
+    return gradient
+
+def clear_caches():
+    gradients.subtle_background_mask.cache_clear()
+    gradients.subtle_background.cache_clear()
+    gradients.border_gradient.cache_clear()
+    gradients.radial_gradient.cache_clear()
+
+def timed(func, *args, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def bench(name, legacy, vectorized, args):
+    legacy_time, expected = timed(legacy, *args, repeat=1)
+
+    def cold(*a):
+        clear_caches()
+        return vectorized(*a)
+
+    cold_time, actual = timed(cold, *args)
+    warm_time, _ = timed(vectorized, *args)
+    identical = expected.tobytes() == actual.tobytes()
+    logging.info(
+        f"{name}: legacy {legacy_time * 1000:.1f}ms, vectorized {cold_time * 1000:.2f}ms, "
+        f"memoized {warm_time * 1000:.4f}ms, identical={identical}"
+    )
+    return identical
+
+def run_benchmarks():
+    results = [
+        bench("subtle background 800x400", legacy_subtle_background,
+              gradients.subtle_background, (800, 400)),
+        bench("radial gradient 800x400", legacy_radial_gradient, gradients.radial_gradient,
+              ((800, 400), (255, 215, 0, 255), (40, 40, 40, 0))),
+    ]
+    for character_type in gradients.BORDER_GRADIENT_COLORS:
+        results.append(bench(f"border gradient 810x410 ({character_type})", legacy_border_gradient,
+                             gradients.border_gradient, (810, 410, character_type)))
+    if not all(results):
+        logging.error("Vectorized gradients differ from the legacy output.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,56 @@
+
+import sys
+import os
+import asyncio
+import logging
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.mongo import client
+from games.collection_store import CollectionStore
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Exercises the collection store against a scratch database on the local mongod:
+#   python scripts/check_collection_store.py
+TEST_DB = 'aura_collection_check'
+
+async def check_collection_store():
+    db = client[TEST_DB]
+    await client.drop_database(TEST_DB)
+    store = CollectionStore(db['users'], db['characters'])
+    await store.start()
+
+    # Concurrent claims by many users must all land.
+    counts = await asyncio.gather(*(store.record_claim(i % 10, '001', '2024-01-01T00:00:00') for i in range(200)))
+    assert sorted(counts)[-1] == 20, counts
+    collection = await store.get_collection(0)
+    assert collection == {'001': 20}, collection
+
+    # A claim inside the cooldown window is refused atomically.
+    assert await store.record_claim(0, '002', '2024-01-01T00:01:00', '2023-12-31T23:51:00') is None
+    assert await store.record_claim(0, '002', '2024-01-01T00:11:00', '2024-01-01T00:01:00') == 1
+    assert await store.record_claim('new', '002', '2024-01-01T00:11:00', '2024-01-01T00:01:00') == 1
+
+    # Concurrent sales can never take more cards than the user owns.
+    results = await asyncio.gather(*(store.take_cards(1, {'001': 3}) for _ in range(20)))
+    sold = [r['001'] for r in results if r is not None]
+    assert len(sold) == 6 and min(sold) == 2, results
+    assert await store.take_cards(1, {'001': 2}) == {'001': 0}
+    assert '001' not in await store.get_collection(1)
+
+    # A multi-card sale takes all of its cards or none of them, and can be undone.
+    await store.record_claim(2, '002', '2024-01-01T00:00:00')
+    assert await store.take_cards(2, {'001': 20, '002': 2}) is None
+    assert await store.get_collection(2) == {'001': 20, '002': 1}
+    assert await store.take_cards(2, {'001': 20, '002': 1}) == {'001': 0, '002': 0}
+    assert await store.get_collection(2) == {}
+    await store.give_cards(2, {'001': 5})
+    assert await store.get_collection(2) == {'001': 5}
+
+    stats = await store.stats()
+    assert stats['users'] == 11, stats
+
+    await client.drop_database(TEST_DB)
+    logging.info("Collection store checks passed")
+
+if __name__ == "__main__":
+    asyncio.run(check_collection_store())
@@ -0,0 +1,73 @@
+import sys
+import os
+import argparse
+import logging
+import random
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from games.catalog import catalog
+from games.sampler import AliasTable, DropSampler
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Checks the drop sampler's statistics against the real catalog:
+#   python scripts/check_drop_distribution.py [--draws 1000000] [--seed 1]
+# Chi-square critical values at p = 0.001, by degrees of freedom.
+CHI2_CRITICAL = {1: 10.83, 2: 13.82, 3: 16.27, 4: 18.47, 5: 20.52, 6: 22.46, 7: 24.32, 8: 26.12, 9: 27.88, 10: 29.59}
+
+def chi_square(observed, expected):
+    return sum((observed.get(key, 0) - count) ** 2 / count for key, count in expected.items() if count > 0)
+
+def check_fit(name, observed, probabilities, draws):
+    total = sum(probabilities.values())
+    expected = {key: draws * p / total for key, p in probabilities.items()}
+    df = len([p for p in probabilities.values() if p > 0]) - 1
+    stat = chi_square(observed, expected)
+    critical = CHI2_CRITICAL.get(df, df + 3.3 * (2 * df) ** 0.5)
+    for key in sorted(expected):
+        logging.info(f"{name} {key}: observed {observed.get(key, 0) / draws:.4%}, expected {expected[key] / draws:.4%}")
+    logging.info(f"{name}: chi-square {stat:.2f} with {df} degrees of freedom (critical {critical:.2f})")
+    assert stat < critical, f"{name} distribution is off: chi-square {stat:.2f} >= {critical:.2f}"
+
+def check_alias_table(rng, draws):
+    weights = [rng.randint(1, 100) for _ in range(10)]
+    table = AliasTable(list(range(10)), weights)
+    observed = Counter(table.sample(rng) for _ in range(draws))
+    check_fit("alias table", observed, dict(enumerate(weights)), draws)
+
+def check_rarities(sampler, draws, guild_id=None):
+    observed = Counter(sampler.sample_rarity(guild_id) for _ in range(draws))
+    probabilities = {t: p for t, p in sampler.probabilities_for(guild_id).items() if catalog.of_type(t)}
+    check_fit(f"rarity (guild {guild_id})", observed, probabilities, draws)
+
+def check_drops(sampler, drops, slots=3):
+    observed = Counter()
+    for _ in range(drops):
+        drop = sampler.sample(slots)
+        ids = [c['id'] for c in drop if c]
+        assert len(ids) == len(set(ids)), f"duplicate characters in a drop: {ids}"
+        observed.update(c['type'] for c in drop if c)
+    # Redraws stay within the slot's rarity, so every slot still follows the configured odds.
+    probabilities = {t: p for t, p in sampler.probabilities_for().items() if catalog.of_type(t)}
+    check_fit("drop slots", observed, probabilities, sum(observed.values()))
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the drop sampler's distributions")
+    parser.add_argument('--draws', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if not catalog.load():
+        sys.exit(1)
+
+    check_alias_table(rng, args.draws)
+    sampler = DropSampler(catalog, rng=rng)
+    check_rarities(sampler, args.draws)
+    sampler.set_guild_probabilities('check', {'legendary': 0.5})
+    check_rarities(sampler, args.draws, 'check')
+    check_drops(sampler, args.draws // 3)
+    logging.info("Drop distribution checks passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import sys
+import os
+import asyncio
+import logging
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.mongo import client
+from db.ledger import AuraLedger
+from games.catalog import catalog
+from games.collection_store import CollectionStore
+from games.journal import TransactionJournal
+from games.sell_engine import SellEngine, SellError
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Exercises sell quotes and settlement against a scratch database on the local mongod:
+#   python scripts/check_sell_engine.py
+TEST_DB = 'aura_sell_check'
+
+async def check_sell_engine():
+    db = client[TEST_DB]
+    await client.drop_database(TEST_DB)
+    store = CollectionStore(db['users'], db['characters'])
+    await store.start()
+    ledger = AuraLedger(db['aura_points'])
+    journal = TransactionJournal(database=db)
+    engine = SellEngine(store, ledger=ledger, journal=journal)
+
+    normal = catalog.of_type('normal')[0]['id']
+    loser = catalog.of_type('loser')[0]['id']
+    for _ in range(3):
+        await store.record_claim(1, normal, '2024-01-01T00:00:00')
+    await store.record_claim(1, loser, '2024-01-01T00:00:00')
+
+    # Quoting the same cards again returns the same price; loser cards are kept.
+    preview = engine.quote(1, {normal: 3, loser: 1})
+    assert engine.quote(1, {normal: 3, loser: 1}) is preview
+    assert preview['sold'] == {normal: 3}, preview['sold']
+    assert 300 <= preview['total'] <= 1500, preview['total']
+
+    # Cancelling a confirmation that reused a preview's quote leaves the preview redeemable.
+    engine.hold(preview)
+    engine.cancel(engine.quote(1, {normal: 3, loser: 1}))
+    assert engine.get_quote(1, preview['token']) is preview
+    assert engine.get_quote(2, preview['token']) is None
+
+    # An unheld quote is forgotten on cancel and can't be executed.
+    single = engine.quote(1, {normal: 1})
+    engine.cancel(single)
+    assert engine.get_quote(1, single['token']) is None
+    try:
+        await engine.execute(single)
+        raise AssertionError("a cancelled quote was executed")
+    except SellError:
+        pass
+
+    # Execute pays the quoted total once, takes only the sellable cards and journals one entry.
+    balance = await engine.execute(preview)
+    assert balance == preview['total'], (balance, preview['total'])
+    assert await store.get_collection(1) == {loser: 1}
+    try:
+        await engine.execute(preview)
+        raise AssertionError("a quote was executed twice")
+    except SellError:
+        pass
+    await journal.flush()
+    entries = [entry async for entry in journal.read(1)]
+    assert len(entries) == 1 and entries[0]['points'] == preview['total'], entries
+
+    # A quote for cards the user no longer owns fails without paying.
+    stale = engine.quote(1, {normal: 1})
+    try:
+        await engine.execute(stale)
+        raise AssertionError("a quote for unowned cards was executed")
+    except SellError:
+        pass
+    assert await ledger.get(1) == balance
+
+    await client.drop_database(TEST_DB)
+    logging.info("Sell engine checks passed")
+
+if __name__ == "__main__":
+    asyncio.run(check_sell_engine())
@@ -1,19 +1,23 @@
-
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import admins_collection
 
-def migrate_admins(json_file='data/admins.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_admins(json_file='data/admins.json'):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    admins_collection.update_one(
+
+    await admins_collection.update_one(
         {'_id': 'admins'},
         {'$set': data},
         upsert=True
     )
+    logging.info(f"Migrated admins from {json_file}")
 
 if __name__ == "__main__":
-    migrate_admins()
\ No newline at end of file
+    asyncio.run(migrate_admins())
@@ -2,19 +2,24 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import aura_data_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_aura_data(json_file='aura_data.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_aura_data(json_file='aura_data.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for user_id, details in data.items():
-        aura_data_collection.update_one(
-            {'user_id': user_id},
-            {'$set': details},
-            upsert=True
-        )
+
+    totals = await bulk_upsert(
+        aura_data_collection,
+        (({'user_id': user_id}, {'$set': details}) for user_id, details in data.items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data)} aura data records ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_aura_data()
\ No newline at end of file
+    asyncio.run(migrate_aura_data())
@@ -1,19 +1,24 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import aura_points_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_aura_points(json_file='aura_points.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_aura_points(json_file='aura_points.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for user_id, points in data.items():
-        aura_points_collection.update_one(
-            {'user_id': user_id},
-            {'$set': {'points': points}},
-            upsert=True
-        )
+
+    totals = await bulk_upsert(
+        aura_points_collection,
+        (({'user_id': user_id}, {'$set': {'points': points}}) for user_id, points in data.items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data)} aura point balances ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_aura_points()
\ No newline at end of file
+    asyncio.run(migrate_aura_points())
@@ -2,18 +2,23 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import authorized_users_collection
 
-def migrate_authorized_users(json_file='authorized_users.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_authorized_users(json_file='authorized_users.json'):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    authorized_users_collection.update_one(
+
+    await authorized_users_collection.update_one(
         {'_id': 'authorized_users'},
         {'$set': data},
         upsert=True
     )
+    logging.info(f"Migrated authorized users from {json_file}")
 
 if __name__ == "__main__":
-    migrate_authorized_users()
\ No newline at end of file
+    asyncio.run(migrate_authorized_users())
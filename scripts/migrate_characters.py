@@ -0,0 +1,29 @@
+
+import sys
+import os
+import json
+import asyncio
+import logging
+from pymongo import ReplaceOne
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.mongo import characters_collection
+from games.collection_store import CollectionStore
+from db.bulk import bulk_write, DEFAULT_BATCH_SIZE
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_characters(json_file='data/characters.json', batch_size=DEFAULT_BATCH_SIZE):
+    with open(json_file, 'r', encoding='utf-8') as f:
+        characters = json.load(f)['characters']
+
+    await CollectionStore().start()
+
+    operations = (
+        ReplaceOne({'id': str(character['id'])}, dict(character, id=str(character['id'])), upsert=True)
+        for character in characters
+    )
+    totals = await bulk_write(characters_collection, operations, batch_size=batch_size)
+    logging.info(f"Migrated {len(characters)} characters ({totals['upserted']} new, {totals['errors']} errors)")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_characters())
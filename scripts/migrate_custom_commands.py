@@ -2,18 +2,23 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import custom_commands_collection
 
-def migrate_custom_commands(json_file='custom_commands.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_custom_commands(json_file='custom_commands.json'):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    custom_commands_collection.update_one(
+
+    await custom_commands_collection.update_one(
         {'_id': 'custom_commands'},
         {'$set': data},
         upsert=True
     )
+    logging.info(f"Migrated custom commands from {json_file}")
 
 if __name__ == "__main__":
-    migrate_custom_commands()
\ No newline at end of file
+    asyncio.run(migrate_custom_commands())
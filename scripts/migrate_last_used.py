@@ -2,19 +2,24 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import last_used_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_last_used(json_file='last_used.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_last_used(json_file='last_used.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for user_id, timestamp in data.items():
-        last_used_collection.update_one(
-            {'user_id': user_id},
-            {'$set': {'last_used': timestamp}},
-            upsert=True
-        )
+
+    totals = await bulk_upsert(
+        last_used_collection,
+        (({'user_id': user_id}, {'$set': {'last_used': timestamp}}) for user_id, timestamp in data.items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data)} last used timestamps ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_last_used()
\ No newline at end of file
+    asyncio.run(migrate_last_used())
@@ -2,19 +2,24 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import role_thresholds_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_role_thresholds(json_file='role_thresholds.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_role_thresholds(json_file='role_thresholds.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for guild_id, roles in data.items():
-        role_thresholds_collection.update_one(
-            {'guild_id': guild_id},
-            {'$set': {'roles': roles}},
-            upsert=True
-        )
+
+    totals = await bulk_upsert(
+        role_thresholds_collection,
+        (({'guild_id': guild_id}, {'$set': {'roles': roles}}) for guild_id, roles in data.items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data)} role threshold sets ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_role_thresholds()
\ No newline at end of file
+    asyncio.run(migrate_role_thresholds())
@@ -2,19 +2,24 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import servers_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_servers(json_file='servers.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def migrate_servers(json_file='servers.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for server_id, details in data.items():
-        servers_collection.update_one(
-            {'server_id': server_id},
-            {'$set': details},
-            upsert=True
-        )
+
+    totals = await bulk_upsert(
+        servers_collection,
+        (({'server_id': server_id}, {'$set': details}) for server_id, details in data.items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data)} servers ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_servers()
\ No newline at end of file
+    asyncio.run(migrate_servers())
@@ -0,0 +1,59 @@
+
+import sys
+import os
+import json
+import asyncio
+import logging
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.mongo import transactions_collection
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
+from games.journal import journal
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Moves sales history into the journal's month partitions (see games/journal.py) from
+# the old data/transactions.json array and the old single `transactions` collection:
+#   python scripts/migrate_transactions.py [--file data/transactions.json] [--drop-legacy]
+# Entries are keyed on (user, card, timestamp), so running the migration twice is harmless.
+
+async def migrate_entries(transactions, batch_size):
+    partitions = {}
+    for transaction in transactions:
+        key = {
+            'user_id': str(transaction['user_id']),
+            'card_id': str(transaction['card_id']),
+            'timestamp': transaction['timestamp']
+        }
+        rest = {k: v for k, v in transaction.items() if k not in key and k != '_id'}
+        partitions.setdefault(journal.partition_name(key['timestamp']), []).append((key, {'$setOnInsert': rest}))
+
+    migrated = 0
+    for name, upserts in sorted(partitions.items()):
+        await journal.ensure_partition(name)
+        totals = await bulk_upsert(journal.database[name], upserts, batch_size=batch_size)
+        migrated += len(upserts)
+        logging.info(f"{name}: {len(upserts)} transactions ({totals['upserted']} new, {totals['errors']} errors)")
+    return migrated
+
+async def migrate_transactions(json_file='data/transactions.json', drop_legacy=False, batch_size=DEFAULT_BATCH_SIZE):
+    if os.path.exists(json_file):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            transactions = json.load(f)
+        migrated = await migrate_entries(transactions, batch_size)
+        logging.info(f"Migrated {migrated} transactions from {json_file}")
+
+    legacy = await transactions_collection.find({}).to_list(length=None)
+    if legacy:
+        migrated = await migrate_entries(legacy, batch_size)
+        logging.info(f"Migrated {migrated} transactions from the {transactions_collection.name} collection")
+        if drop_legacy:
+            await transactions_collection.drop()
+            logging.info(f"Dropped the {transactions_collection.name} collection")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move sales history into the transaction journal")
+    parser.add_argument('--file', default='data/transactions.json')
+    parser.add_argument('--drop-legacy', action='store_true', help="drop the old transactions collection afterwards")
+    args = parser.parse_args()
+    asyncio.run(migrate_transactions(args.file, args.drop_legacy))
@@ -2,19 +2,42 @@
 import sys
 import os
 import json
+import asyncio
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.mongo import users_collection
+from games.collection_store import CollectionStore
+from db.bulk import bulk_upsert, DEFAULT_BATCH_SIZE
 
-def migrate_users(json_file='data/users.json'):
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def normalize_claims(claims):
+    """Turn any stored claims format into a {card id: count} map."""
+    if isinstance(claims, list):
+        counts = {}
+        for claim in claims:
+            char_id = str(claim['id'])
+            counts[char_id] = counts.get(char_id, 0) + 1
+        return counts
+    if not isinstance(claims, dict):
+        return {}
+    return {str(k): v for k, v in claims.items() if isinstance(v, int) and v > 0}
+
+async def migrate_users(json_file='data/users.json', batch_size=DEFAULT_BATCH_SIZE):
     with open(json_file, 'r') as f:
         data = json.load(f)
-    
-    for user_id, details in data['users'].items():
-        users_collection.update_one(
-            {'user_id': user_id},
-            {'$set': details},
-            upsert=True
-        )
+
+    await CollectionStore().start()
+
+    totals = await bulk_upsert(
+        users_collection,
+        (({'user_id': str(user_id)}, {'$set': {
+            'last_claim': details.get('last_claim'),
+            'claimed_characters': normalize_claims(details.get('claimed_characters'))
+        }}) for user_id, details in data['users'].items()),
+        batch_size=batch_size
+    )
+    logging.info(f"Migrated {len(data['users'])} users ({totals['upserted']} new, {totals['errors']} errors)")
 
 if __name__ == "__main__":
-    migrate_users()
\ No newline at end of file
+    asyncio.run(migrate_users())
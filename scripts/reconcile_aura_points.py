@@ -0,0 +1,57 @@
+
+import sys
+import os
+import json
+import asyncio
+import logging
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.ledger import ledger
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# The drop and sell games used to keep their own balances in aura_points.json
+# (loser penalties and card sales) while every other cog used MongoDB. This
+# folds what the games added into the ledger, once.
+#
+# aura_points.json started as a copy of the balances that were imported into
+# MongoDB, so only the change since then belongs to the games. Pass that
+# original export as --baseline to add just the difference; without it the
+# whole JSON balance is added. The JSON file is renamed afterwards so the
+# job can't be applied twice.
+
+def load_balances(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return {str(user_id): int(points) for user_id, points in json.load(f).items()}
+
+async def reconcile_aura_points(json_file='aura_points.json', baseline_file=None, dry_run=False):
+    balances = load_balances(json_file)
+    baseline = load_balances(baseline_file) if baseline_file else {}
+
+    deltas = {
+        user_id: points - baseline.get(user_id, 0)
+        for user_id, points in balances.items()
+        if points != baseline.get(user_id, 0)
+    }
+    logging.info(f"{len(deltas)} of {len(balances)} balances in {json_file} need folding in")
+
+    if dry_run:
+        current = await ledger.bulk_get(deltas)
+        for user_id, delta in sorted(deltas.items()):
+            logging.info(f"{user_id}: {current[user_id]:,} -> {current[user_id] + delta:,} ({delta:+,})")
+        return
+
+    for user_id, delta in deltas.items():
+        new_balance = await ledger.add(user_id, delta)
+        logging.info(f"{user_id}: {delta:+,} -> {new_balance:,}")
+
+    os.replace(json_file, json_file + '.reconciled')
+    logging.info(f"Reconciled {len(deltas)} balances; moved {json_file} to {json_file}.reconciled")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fold aura_points.json balances into the MongoDB ledger")
+    parser.add_argument('--file', default='aura_points.json')
+    parser.add_argument('--baseline', help="balances file the JSON started from (the original MongoDB import)")
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+    asyncio.run(reconcile_aura_points(args.file, args.baseline, args.dry_run))
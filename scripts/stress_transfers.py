@@ -0,0 +1,63 @@
+
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.mongo import client
+from db.ledger import AuraLedger
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Fires many simultaneous transfers out of one account at a scratch database
+# on the local mongod and checks the ledger invariants afterwards:
+#   python scripts/stress_transfers.py --trades 500 --balance 10000 --amount 30
+TEST_DB = 'aura_transfer_stress'
+
+async def stress_transfers(trades, balance, amount, recipients):
+    await client.drop_database(TEST_DB)
+    collection = client[TEST_DB]['aura_points']
+    await collection.create_index('user_id', unique=True)
+    ledger = AuraLedger(collection)
+
+    await ledger.add('sender', balance)
+    targets = [f'recipient{i}' for i in range(recipients)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        ledger.transfer('sender', targets[i % recipients], amount) for i in range(trades)
+    ))
+    elapsed = time.perf_counter() - start
+
+    succeeded = [r for r in results if r is not None]
+    ledger.invalidate()
+    final = await ledger.bulk_get(['sender'] + targets)
+    total = sum(final.values())
+
+    expected_successes = min(trades, balance // amount)
+    logging.info(
+        f"{trades} trades in {elapsed:.2f}s ({trades / elapsed:.0f}/s): "
+        f"{len(succeeded)} succeeded, {trades - len(succeeded)} refused"
+    )
+    logging.info(f"Sender balance {final['sender']:,}, total points {total:,}")
+
+    assert final['sender'] >= 0, "sender overdrawn"
+    assert total == balance, f"points were created or lost: {total} != {balance}"
+    assert len(succeeded) == expected_successes, f"{len(succeeded)} != {expected_successes}"
+    assert final['sender'] == balance - len(succeeded) * amount
+    if succeeded:
+        assert min(r[0] for r in succeeded) == final['sender']
+
+    await client.drop_database(TEST_DB)
+    logging.info("All transfer invariants held")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent aura transfer stress test")
+    parser.add_argument('--trades', type=int, default=500)
+    parser.add_argument('--balance', type=int, default=10000)
+    parser.add_argument('--amount', type=int, default=30)
+    parser.add_argument('--recipients', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(stress_transfers(args.trades, args.balance, args.amount, args.recipients))
@@ -4,8 +4,8 @@ from discord import app_commands
 import logging
 from .shop_helpers import (
     send_response,
-    load_shops,
-    save_shops
+    load_shop,
+    save_shop
 )
 
 class AddItem(commands.Cog):
@@ -67,15 +67,12 @@ class AddItem(commands.Cog):
                 await send_response(ctx, "Cost cannot exceed 1,000,000 Aura points.")
                 return
 
-            shops = await load_shops()
             guild_id = str(ctx.guild.id)
             logging.info(f"AddItem - Guild ID: {guild_id}")
-
-            if guild_id not in shops:
-                shops[guild_id] = []
+            items = await load_shop(guild_id)
 
             # Check if item already exists
-            if any(item["role_id"] == role.id for item in shops[guild_id]):
+            if any(item["role_id"] == role.id for item in items):
                 await send_response(ctx, f"The role '{role.name}' is already in the shop.")
                 return
 
@@ -85,8 +82,8 @@ class AddItem(commands.Cog):
                 "cost": cost
             }
 
-            shops[guild_id].append(item)
-            await save_shops(shops)
+            items.append(item)
+            await save_shop(guild_id, items)
             embed = discord.Embed(
                 title="✅ Item Added",
                 description=f"Successfully added **{role.name}** to the shop!"
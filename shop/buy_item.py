@@ -3,14 +3,11 @@ from discord.ext import commands
 from discord import app_commands
 import logging
 from .shop_helpers import (
-    save_shops, 
-    send_response, 
-    get_user_aura_points, 
-    handle_purchase, 
-    load_shops, 
-    load_aura_points, 
-    save_aura_points
+    send_response,
+    handle_purchase,
+    load_shop
 )
+from db.ledger import ledger
 
 class BuyItem(commands.Cog):
     def __init__(self, bot):
@@ -41,11 +38,9 @@ class BuyItem(commands.Cog):
             user = ctx.author if isinstance(ctx, commands.Context) else ctx.user
             user_id = str(user.id)
 
-            shops = await load_shops()
-            aura_points = await load_aura_points()
-            user_aura_points = get_user_aura_points(aura_points, user_id)
+            items = await load_shop(guild_id)
 
-            if guild_id not in shops or not shops[guild_id]:
+            if not items:
                 embed = discord.Embed(
                     title="🛍️ Empty Shop",
                     description="The shop is currently empty. Please check back later!"
@@ -53,11 +48,11 @@ class BuyItem(commands.Cog):
                 await send_response(ctx, embed=embed)
                 return
 
-            item_to_buy = next((item for item in shops[guild_id] 
+            item_to_buy = next((item for item in items
                                if item["name"].lower() == name.lower()), None)
             
             if not item_to_buy:
-                similar_items = [item["name"] for item in shops[guild_id] 
+                similar_items = [item["name"] for item in items
                                if name.lower() in item["name"].lower()]
                 
                 embed = discord.Embed(
@@ -78,7 +73,10 @@ class BuyItem(commands.Cog):
                 await send_response(ctx, f"You already have the '{role.name}' role!")
                 return
 
-            if user_aura_points < item_to_buy['cost']:
+            # Conditional debit: only succeeds if the user still has enough points
+            new_balance = await ledger.debit(user_id, item_to_buy['cost'])
+            if new_balance is None:
+                user_aura_points = await ledger.get(user_id)
                 embed = discord.Embed(
                     title="❌ Insufficient Aura Points",
                     description=f"You need **{item_to_buy['cost'] - user_aura_points:,}** more Aura points to buy this item.",
@@ -95,16 +93,15 @@ class BuyItem(commands.Cog):
                 await send_response(ctx, embed=embed)
                 return
 
-            # Process the purchase
-            aura_points[user_id] = user_aura_points - item_to_buy['cost']
-            await save_aura_points(aura_points)
-            
             try:
-                await handle_purchase(user, item_to_buy)
-            except discord.Forbidden:
+                assigned = await handle_purchase(user, item_to_buy)
+            except discord.HTTPException as e:
+                logging.error(f"Role assignment failed for {user_id}: {e}")
+                assigned = False
+
+            if not assigned:
                 # Refund points if role assignment fails
-                aura_points[user_id] = user_aura_points
-                await save_aura_points(aura_points)
+                await ledger.add(user_id, item_to_buy['cost'])
                 await send_response(ctx, "Failed to assign the role. Please contact an administrator.")
                 return
 
@@ -115,7 +112,7 @@ class BuyItem(commands.Cog):
             )
             embed.add_field(
                 name="Remaining Balance", 
-                value=f"**{aura_points[user_id]:,}** Aura points"
+                value=f"**{new_balance:,}** Aura points"
             )
             await send_response(ctx, embed=embed)
 
@@ -2,7 +2,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
-from .shop_helpers import load_shops, save_shops, send_response
+from .shop_helpers import load_shop, save_shop, send_response
 
 class RemoveItem(commands.Cog):
     def __init__(self, bot):
@@ -31,10 +31,10 @@ class RemoveItem(commands.Cog):
 
     async def remove_item_logic(self, ctx, name):
         try:
-            shops = await load_shops()
             guild_id = str(ctx.guild.id)
+            items = await load_shop(guild_id)
             
-            if guild_id not in shops or not shops[guild_id]:
+            if not items:
                 embed = discord.Embed(
                     title="🛍️ Shop Empty",
                     description="There are no items in the shop to remove."
@@ -42,12 +42,12 @@ class RemoveItem(commands.Cog):
                 await send_response(ctx, embed=embed)
                 return
 
-            item_to_remove = next((item for item in shops[guild_id] if item["name"].lower() == name.lower()), None)
+            item_to_remove = next((item for item in items if item["name"].lower() == name.lower()), None)
             
             if item_to_remove:
                 role = ctx.guild.get_role(item_to_remove['role_id'])
-                shops[guild_id].remove(item_to_remove)
-                await save_shops(shops)
+                items.remove(item_to_remove)
+                await save_shop(guild_id, items)
                 
                 embed = discord.Embed(
                     title="✅ Item Removed",
@@ -61,7 +61,7 @@ class RemoveItem(commands.Cog):
                 )
                 await send_response(ctx, embed=embed)
             else:
-                similar_items = [item["name"] for item in shops[guild_id] 
+                similar_items = [item["name"] for item in items
                                if name.lower() in item["name"].lower()]
                 
                 embed = discord.Embed(
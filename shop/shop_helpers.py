@@ -2,7 +2,8 @@ import discord
 import logging
 import os  # Imported os to handle file paths
 from discord.ext import commands
-from db.mongo import shops_collection, aura_points_collection  # Updated imports
+from db.mongo import shops_collection  # Updated imports
+from db.bulk import bulk_upsert
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -19,46 +20,37 @@ async def load_shops():
         logging.error(f"Error loading shops from MongoDB: {e}")
         return {}
 
-# Function to save shops to MongoDB
-async def save_shops(shops):
+# Function to load a single guild's shop items from MongoDB
+async def load_shop(guild_id):
     try:
-        for guild_id, items in shops.items():
-            await shops_collection.update_one(
-                {"_id": guild_id},
-                {"$set": {"items": items}},
-                upsert=True
-            )
-        logging.info("Shops saved successfully to MongoDB.")
+        doc = await shops_collection.find_one({"_id": str(guild_id)}, {"items": 1})
+        return doc.get('items', []) if doc else []
     except Exception as e:
-        logging.error(f"Error saving shops to MongoDB: {e}")
+        logging.error(f"Error loading shop for guild {guild_id} from MongoDB: {e}")
+        return []
 
-# Function to load aura points from MongoDB
-async def load_aura_points():
+# Function to save a single guild's shop items to MongoDB
+async def save_shop(guild_id, items):
     try:
-        aura_points = {}
-        cursor = aura_points_collection.find({})
-        async for doc in cursor:
-            # Changed from doc['_id'] to doc['user_id']
-            aura_points[doc['user_id']] = doc.get('points', 0)
-        logging.info("Aura points loaded successfully from MongoDB.")
-        return aura_points
+        await shops_collection.update_one(
+            {"_id": str(guild_id)},
+            {"$set": {"items": items}},
+            upsert=True
+        )
+        logging.info(f"Shop for guild {guild_id} saved successfully to MongoDB.")
     except Exception as e:
-        logging.error(f"Error loading aura points from MongoDB: {e}")
-        return {}
+        logging.error(f"Error saving shop for guild {guild_id} to MongoDB: {e}")
 
-# Function to save aura points to MongoDB
-async def save_aura_points(aura_points):
+# Function to save shops to MongoDB
+async def save_shops(shops):
     try:
-        for user_id, points in aura_points.items():
-            # Changed from {"_id": user_id} to {"user_id": user_id}
-            await aura_points_collection.update_one(
-                {"user_id": user_id},
-                {"$set": {"points": points}},
-                upsert=True
-            )
-        logging.info("Aura points saved successfully to MongoDB.")
+        totals = await bulk_upsert(
+            shops_collection,
+            (({"_id": guild_id}, {"$set": {"items": items}}) for guild_id, items in shops.items())
+        )
+        logging.info(f"Shops saved to MongoDB: {totals['upserted']} new, {totals['modified']} updated, {totals['errors']} errors.")
     except Exception as e:
-        logging.error(f"Error saving aura points to MongoDB: {e}")
+        logging.error(f"Error saving shops to MongoDB: {e}")
 
 # Function to send responses, handling both context and interaction types
 async def send_response(ctx, content=None, embed=None):
@@ -75,19 +67,20 @@ async def send_response(ctx, content=None, embed=None):
     except Exception as e:
         logging.error(f"Error in send_response: {e}")
 
-# Function to retrieve a user's Aura points
-def get_user_aura_points(aura_points, member_id):
-    return aura_points.get(str(member_id), 0)
-
-# Function to handle item purchases, specifically for roles
+# Function to handle item purchases, specifically for roles.
+# Returns True if the role was assigned; failing to DM the member doesn't count as a failure.
 async def handle_purchase(member, item):
     guild = member.guild
     role = guild.get_role(item['role_id'])
-    if role:
-        await member.add_roles(role)
+    if not role:
+        logging.warning(f"Role with ID '{item['role_id']}' not found in guild {guild.id}.")
+        return False
+    await member.add_roles(role)
+    try:
         await member.send(f"You have received the role '{role.name}' in **{guild.name}**!")
-    else:
-        await member.send(f"Role with ID '{item['role_id']}' not found in the server **{guild.name}**.")
+    except discord.HTTPException:
+        logging.warning(f"Could not DM {member.id} about their purchase of '{role.name}'.")
+    return True
 
 class ShopHelpers(commands.Cog):
     def __init__(self, bot):
@@ -4,10 +4,9 @@ from discord import app_commands
 import logging
 from .shop_helpers import (
     send_response,
-    load_shops,
-    load_aura_points,
-    get_user_aura_points
+    load_shop
 )
+from db.ledger import ledger
 
 class ShowShop(commands.Cog):
     def __init__(self, bot):
@@ -27,14 +26,13 @@ class ShowShop(commands.Cog):
 
     async def show_shop_logic(self, ctx):
         try:
-            shops = await load_shops()
             guild_id = str(ctx.guild.id)
+            items = await load_shop(guild_id)
             
             user_id = str(ctx.author.id) if isinstance(ctx, commands.Context) else str(ctx.user.id)
-            aura_points = await load_aura_points()
-            user_balance = get_user_aura_points(aura_points, user_id)
+            user_balance = await ledger.get(user_id)
 
-            if guild_id not in shops or not shops[guild_id]:
+            if not items:
                 embed = discord.Embed(
                     title="🛍️ Aura Shop",
                     description="The shop is currently empty."
@@ -71,7 +69,7 @@ class ShowShop(commands.Cog):
             affordable_items = []
             unaffordable_items = []
             
-            for item in shops[guild_id]:
+            for item in items:
                 role = ctx.guild.get_role(item['role_id'])
                 if role:
                     item_display = (